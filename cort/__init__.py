@@ -1,3 +1,6 @@
 """ cort - a toolkit for coreference resolution and error analysis. """
 
 __author__ = 'martscsn'
+
+# keep in sync with setup.py
+__version__ = '0.2.4.5'
@@ -200,7 +200,7 @@ class EnhancedSet:
             return False
 
     def __hash__(self):
-        return hash(self.data)
+        return hash(frozenset(self.data))
 
     def __repr__(self):
         return sorted(self.data).__repr__()
@@ -225,13 +225,7 @@ class EnhancedSet:
         Returns:
             EnhancedSet: An EnhancedSet filtered by the function.
         """
-        filtered = set()
-
-        for datum in self.data:
-            if function(datum):
-                filtered.add(datum)
-
-        return EnhancedSet(filtered)
+        return EnhancedSet({datum for datum in self.data if function(datum)})
 
     def categorize(self, categorizer,
                    corpora=None,
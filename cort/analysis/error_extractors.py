@@ -177,11 +177,9 @@ class ErrorExtractor:
                                    spanning_tree_algorithm):
         partitioned_graph = graph.partition(partitioning_graphs)
         spanning_tree = spanning_tree_algorithm(graph, partitioned_graph)
-        extra_pairs = [
+        # errors end up in an EnhancedSet, so there is no need to sort them
+        return [
             (anaphor, antecedent) for anaphor, antecedent in spanning_tree
             if anaphor not in partitioned_graph.edges or
             antecedent not in partitioned_graph.edges[anaphor]
         ]
-
-        return [(anaphor, antecedent) for anaphor, antecedent in sorted(
-            extra_pairs)]
@@ -1,6 +1,6 @@
 from __future__ import print_function
 
-import codecs
+import io
 import shutil
 import os
 import webbrowser
@@ -168,7 +168,7 @@ class Visualizer:
 
         output = "temp/output/error_analysis.html"
 
-        f = codecs.open(output, "w", "utf-8")
+        f = io.open(output, "w", encoding="utf-8")
 
         abs_path = os.path.abspath(output)
 
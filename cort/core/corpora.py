@@ -65,15 +65,16 @@ class Corpus:
 
         document_as_strings = []
 
-        current_document = ""
+        current_document = []
 
-        for line in coref_file.readlines():
-            if line.startswith("#begin") and current_document != "":
-                document_as_strings.append(current_document)
-                current_document = ""
-            current_document += line
+        # read line by line and join the lines of each document once
+        for line in coref_file:
+            if line.startswith("#begin") and current_document:
+                document_as_strings.append("".join(current_document))
+                current_document = []
+            current_document.append(line)
 
-        document_as_strings.append(current_document)
+        document_as_strings.append("".join(current_document))
 
         return Corpus(description, sorted([from_string(doc) for doc in
                                            document_as_strings]))
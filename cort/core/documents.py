@@ -4,6 +4,7 @@ In particular, classes in this module allow to access the linguistic
 information present in documents.
 """
 
+import bisect
 from collections import defaultdict
 import logging
 
@@ -95,6 +96,11 @@ class Document(object):
             self.dep.append(dep)
             self.speakers += speakers
 
+        # sentence spans are sorted and disjoint, so we can search the
+        # sentence of a span via bisection on the sentence starts
+        self.__sentence_begins = [sentence_span.begin for sentence_span
+                                  in self.sentence_spans]
+
         self.annotated_mentions = self.__get_annotated_mentions()
         self.system_mentions = []
 
@@ -216,14 +222,16 @@ class Document(object):
                 "antecedent"] = spans_to_annotated_mentions[
                     span_antecedent]
 
+        # sort and rebuild coreference information once after all decisions
+        # have been read in, instead of after every single decision
+        if span_pairs:
             self.annotated_mentions = sorted(
-                list(spans_to_annotated_mentions.values()))
+                spans_to_annotated_mentions.values())
 
             self.coref.clear()
 
-            for span in spans_to_annotated_mentions:
-                self.coref[span] = spans_to_annotated_mentions[
-                    span].attributes["annotated_set_id"]
+            for span, mention in spans_to_annotated_mentions.items():
+                self.coref[span] = mention.attributes["annotated_set_id"]
 
     def get_antecedent_decisions(self, which_mentions="annotated"):
         """ Get all antecedent decisions in this document.
@@ -263,9 +271,10 @@ class Document(object):
             Span: The span of the sentence which embeds the text corresponding
             to the span.
         """
-        for i, sentence_span in enumerate(self.sentence_spans):
-            if sentence_span.embeds(span):
-                return i, sentence_span
+        i = bisect.bisect_right(self.__sentence_begins, span.begin) - 1
+
+        if i >= 0 and self.sentence_spans[i].embeds(span):
+            return i, self.sentence_spans[i]
 
     def to_simple_output(self):
         """ Convert the document into a simple textual representation,
@@ -374,11 +383,30 @@ class CoNLLDocument(Document):
                 document_as_string (str): A representation of a document in
                     the CoNLL format.
             """
-        identifier = " ".join(document_as_string.split("\n")[0].split(" ")[2:])
+        identifier = " ".join(
+            document_as_string.split("\n", 1)[0].split(" ")[2:])
 
         self.document_table = CoNLLDocument.__string_to_table(
             document_as_string)
-        in_sentence_ids = [int(i) for i in self.__extract_from_column(2)]
+
+        # extract all needed columns in one pass over the table
+        in_sentence_ids = []
+        temp_tokens = []
+        temp_pos = []
+        parse_bits = []
+        temp_speakers = []
+        ner_entries = []
+        coref_entries = []
+
+        for row in self.document_table:
+            in_sentence_ids.append(int(row[2]))
+            temp_tokens.append(row[3])
+            temp_pos.append(row[4])
+            parse_bits.append(row[5])
+            temp_speakers.append(row[9])
+            ner_entries.append(row[10])
+            coref_entries.append(row[-1])
+
         indexing_start = in_sentence_ids[0]
         if indexing_start != 0:
             logger.warning("Detected " +
@@ -387,13 +415,10 @@ class CoNLLDocument(Document):
                            "transformed to 0-based indexing.")
             in_sentence_ids = [i - indexing_start for i in in_sentence_ids]
         sentence_spans = CoNLLDocument.__extract_sentence_spans(in_sentence_ids)
-        temp_tokens = self.__extract_from_column(3)
-        temp_pos = self.__extract_from_column(4)
-        temp_ner = self.__extract_ner()
-        temp_speakers = self.__extract_from_column(9)
-        coref = CoNLLDocument.__get_span_to_id(self.__extract_from_column(-1))
+        temp_ner = CoNLLDocument.__extract_ner(ner_entries)
+        coref = CoNLLDocument.__get_span_to_id(coref_entries)
         parses = [CoNLLDocument.get_parse(span,
-                                          self.__extract_from_column(5),
+                                          parse_bits,
                                           temp_pos,
                                           temp_tokens)
                   for span in sentence_spans]
@@ -414,20 +439,16 @@ class CoNLLDocument(Document):
 
         super(CoNLLDocument, self).__init__(identifier, sentences, coref)
 
-    def __extract_from_column(self, column):
-        entries = []
-        for line in self.document_table:
-            entries.append(line[column])
-
-        return entries
-
-    def __extract_ner(self):
-        entries = self.__extract_from_column(10)
+    @staticmethod
+    def __extract_ner(entries):
         ner = []
 
         tag = "NONE"
-        for i in range(0, len(entries)):
-            entry = entries[i]
+        for entry in entries:
+            # most entries are "*", which neither opens nor closes a tag
+            if entry == "*":
+                ner.append(tag)
+                continue
 
             if "(" in entry:
                 tag = entry.strip("(").strip(")").strip("*")
@@ -441,15 +462,11 @@ class CoNLLDocument(Document):
 
     @staticmethod
     def __string_to_table(document_as_string):
-        table = []
-
         document_contents = document_as_string.split("\n")[1:-2]
 
-        for line in document_contents:
-            if line != "" and not line.isspace():
-                table.append(line.split())
-
-        return table
+        # blank lines separate sentences and split to empty rows
+        return [row for row in (line.split() for line in document_contents)
+                if row]
 
     @staticmethod
     def __extract_sentence_spans(in_sentence_ids):
@@ -473,24 +490,23 @@ class CoNLLDocument(Document):
 
         ids_to_stack = defaultdict(list)
 
-        for i in range(0, len(column)):
-            entry = column[i]
-
-            if entry != "-":
-                parallel_annotations = entry.split("|")
-
-                for annotation in parallel_annotations:
-                    if annotation.startswith("(") and annotation.endswith(")"):
-                        set_id = annotation[1:-1]
-                        span_to_id[spans.Span(i, i)] = int(set_id)
-                    elif annotation.startswith("("):
-                        set_id = annotation[1:]
-                        ids_to_stack[set_id].append(i)
-                    elif annotation.endswith(")"):
-                        set_id = annotation[:-1]
-                        span_to_id[
-                            spans.Span(ids_to_stack[set_id].pop(), i)
-                        ] = int(set_id)
+        for i, entry in enumerate(column):
+            if entry == "-":
+                continue
+
+            for annotation in entry.split("|"):
+                opens = annotation[:1] == "("
+                closes = annotation[-1:] == ")"
+
+                if opens and closes:
+                    span_to_id[spans.Span(i, i)] = int(annotation[1:-1])
+                elif opens:
+                    ids_to_stack[annotation[1:]].append(i)
+                elif closes:
+                    set_id = annotation[:-1]
+                    span_to_id[
+                        spans.Span(ids_to_stack[set_id].pop(), i)
+                    ] = int(set_id)
 
         return span_to_id
 
@@ -504,14 +520,13 @@ class CoNLLDocument(Document):
         Returns:
             str: A string representation of the parse tree of the span.
         """
-        parse_tree = ""
-        for i in range(span.begin, span.end+1):
-            parse_bit = parses_as_string[i]
-            parse_tree += \
-                parse_bit.replace("(", " (").replace(
-                    "*", " (" + pos[i] + " " + tokens[i] + ")")
+        parse_tree = [
+            parses_as_string[i].replace("(", " (").replace(
+                "*", " (" + pos[i] + " " + tokens[i] + ")")
+            for i in range(span.begin, span.end+1)
+        ]
 
-        return parse_tree.strip()
+        return "".join(parse_tree).strip()
 
     def get_string_representation(self):
         """ Get a string representation of the document.
@@ -530,23 +545,13 @@ class CoNLLDocument(Document):
         for row, mention_row in zip(new_table, mention_string_representation):
             row[-1] = mention_row
 
-        padded_table = []
-
-        current_row = new_table[0]
-        padded_table.append(current_row)
-
-        for i in range(1, len(new_table)):
-            previous_row = current_row
-            current_row = new_table[i]
-
-            if int(current_row[2]) <= int(previous_row[2]):
-                padded_table.append("")
-
-            padded_table.append(current_row)
-
         begin = ("#begin document " + self.identifier + "\n")
 
-        content = "\n".join(["\t".join(row) for row in padded_table])
+        # sentences are separated by an empty line
+        content = "\n\n".join(
+            "\n".join(["\t".join(row) for row
+                       in new_table[span.begin:span.end + 1]])
+            for span in self.sentence_spans)
 
         end = "\n#end document\n"
 
@@ -570,14 +575,11 @@ class CoNLLDocument(Document):
                 index_to_strings[span.begin].append("(" + str(set_id))
                 index_to_strings[span.end].append(str(set_id) + ")")
 
-        output_with_parallel_annotations = []
+        # only few tokens carry annotations, so we only visit these
+        output_with_parallel_annotations = ["-"] * (length+1)
 
-        for i in range(0, length+1):
-            if i in index_to_strings:
-                output_with_parallel_annotations.append(
-                    "|".join(sorted(index_to_strings[i])))
-            else:
-                output_with_parallel_annotations.append("-")
+        for i, strings in index_to_strings.items():
+            output_with_parallel_annotations[i] = "|".join(sorted(strings))
 
         return output_with_parallel_annotations
 
@@ -28,17 +28,16 @@ class GenderData:
         directory = cort.__path__[0] + "/resources/"
 
         lists = [
-            open(directory + "male.list"),
-            open(directory + "female.list"),
-            open(directory + "neutral.list"),
-            open(directory + "plural.list")
+            ("MALE", directory + "male.list"),
+            ("FEMALE", directory + "female.list"),
+            ("NEUTRAL", directory + "neutral.list"),
+            ("PLURAL", directory + "plural.list")
         ]
 
-        genders = ["MALE", "FEMALE", "NEUTRAL", "PLURAL"]
-
-        for gender, gender_list in zip(genders, lists):
-            for word in gender_list.readlines():
-                self.word_to_gender[word.strip()] = gender
+        for gender, gender_list in lists:
+            with open(gender_list) as words:
+                self.word_to_gender.update(
+                    dict.fromkeys(words.read().splitlines(), gender))
 
     def look_up(self, attributes):
         """ Look up the gender of a mention described by the input attributes.
@@ -46,26 +45,43 @@ class GenderData:
         Args:
             attributes (dict(str,object)): A dict describing attributes of
                 mentions. Must contain "tokens" and "head", which have lists
-                of strings as values.
+                of strings as values. If present, the lowercased strings in
+                "tokens_as_lowercase_string" and "head_as_lowercase_string"
+                are used instead of joining the tokens again.
 
         Returns:
             (str): None or one of the four genders 'MALE', 'FEMALE',
             'NEUTRAL' or 'PLURAL'.
         """
         # whole string
-        if " ".join(attributes["tokens"]).lower() in self.word_to_gender:
-            return self.word_to_gender[" ".join(attributes["tokens"]).lower()]
+        if "tokens_as_lowercase_string" in attributes:
+            tokens = attributes["tokens_as_lowercase_string"]
+        else:
+            tokens = " ".join(attributes["tokens"]).lower()
+
+        gender = self.word_to_gender.get(tokens)
+
         # head
-        elif " ".join(attributes["head"]).lower() in self.word_to_gender:
-            return self.word_to_gender[" ".join(attributes["head"]).lower()]
+        if not gender:
+            if "head_as_lowercase_string" in attributes:
+                head = attributes["head_as_lowercase_string"]
+            else:
+                head = " ".join(attributes["head"]).lower()
+
+            gender = self.word_to_gender.get(head)
+
         # head token by token
-        elif self.__look_up_token_by_token(attributes["head"]):
-            return self.__look_up_token_by_token(attributes["head"])
+        if not gender:
+            gender = self.__look_up_token_by_token(attributes["head"])
+
+        return gender
 
     def __look_up_token_by_token(self, tokens):
         for token in tokens:
-            if token[0].isupper() and token.lower() in self.word_to_gender:
-                return self.word_to_gender[token.lower()]
+            if token[0].isupper():
+                gender = self.word_to_gender.get(token.lower())
+                if gender:
+                    return gender
 
 
 @singletons.Singleton
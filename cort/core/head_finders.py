@@ -1,7 +1,8 @@
 """ Compute heads of mentions. """
 
 import logging
-import re
+
+import nltk
 
 from cort.core import spans
 
@@ -10,6 +11,51 @@ logger = logging.getLogger(__name__)
 __author__ = 'smartschat'
 
 
+# rules for adjusting heads of proper names, as (start, stop) pairs: the head
+# starts at the first part-of-speech tag with one of the start prefixes, and
+# ends before the next tag with one of the stop prefixes (or equal to one of
+# the stop tags)
+_nn = ("NN",)
+_nn_or_cd = ("NN", "CD")
+
+_default_stop = (("CC", ",", ".", ":", ";", "V", "IN", "W", "ADVP"),
+                 frozenset(["NN"]))
+_org_like_stop = (("V", "IN", "W", "ADVP", ",", "-LRB-"), frozenset())
+_person_stop = (("IN", "CC", ",", ".", ":", ";", "V", "W", "-LRB-"),
+                frozenset())
+
+_org_like_types = ("ORG", "GPE", "FAC", "NORP", "PRODUCT", "EVENT", "MONEY",
+                   "WORK_OF_ART", "LOC", "LAW", "LANGUAGE")
+
+# types are matched by prefix, in this order
+_head_adjustment_rules = [
+    (_org_like_types, (_nn, _org_like_stop)),
+    (("DATE", "TIME"), (_nn_or_cd, _default_stop)),
+    (("ORDINAL",), (("NN", "JJ", "RB"), _default_stop)),
+    (("CARDINAL",), (("CD",), _default_stop)),
+    (("QUANTITY", "PERCENT"), (("CD", "JJ", "NN"), _default_stop)),
+]
+
+# named entity types are few, so rules are resolved once per type
+_head_adjustment_rule_for_type = {
+    "PERSON": (_nn, _person_stop),
+    "NONE": (_nn_or_cd, _default_stop),
+}
+
+
+def _get_head_adjustment_rule(ner_type):
+    if ner_type not in _head_adjustment_rule_for_type:
+        rule = None
+        for type_prefixes, type_rule in _head_adjustment_rules:
+            if ner_type.startswith(type_prefixes):
+                rule = type_rule
+                break
+
+        _head_adjustment_rule_for_type[ner_type] = rule
+
+    return _head_adjustment_rule_for_type[ner_type]
+
+
 class HeadFinder:
     """Compute heads of mentions.
 
@@ -24,9 +70,9 @@ class HeadFinder:
     names to multi-token phrases via heuristics (see adjust_head_for_nam).
     """
     def __init__(self):
-        self.__nonterminals = ["NP", "NML", "VP", "ADJP", "QP", "WHADVP", "S",
-                             "ADVP", "WHNP", "SBAR", "SBARQ", "PP", "INTJ",
-                             "SQ", "UCP", "X", "FRAG"]
+        self.__nonterminals = {"NP", "NML", "VP", "ADJP", "QP", "WHADVP", "S",
+                               "ADVP", "WHNP", "SBAR", "SBARQ", "PP", "INTJ",
+                               "SQ", "UCP", "X", "FRAG"}
 
 
         self.__nonterminal_rules = {
@@ -53,6 +99,34 @@ class HeadFinder:
             "UCP": (["*"], True),
         }
 
+        # map each label in a rule to its priority (lower is better), such
+        # that the children only need to be scanned once
+        self.__nonterminal_priorities = {}
+        for label, (values, traverse_reversed) in \
+                self.__nonterminal_rules.items():
+            priorities = {}
+            for val in values:
+                priorities.setdefault(val, len(priorities))
+            self.__nonterminal_priorities[label] = (priorities,
+                                                    traverse_reversed)
+
+        # the rules for NP and NML in the order they are tried, and whether
+        # the head has to be computed recursively for the subtree they return
+        self.__np_rules = (
+            (self.__rule_cc, False),
+            (self.__collins_rule_nn, False),
+            (self.__collins_rule_np, True),
+            (self.__collins_rule_nml, True),
+            (self.__collins_rule_prn, False),
+            (self.__collins_rule_cd, False),
+            (self.__collins_rule_jj, False),
+            (self.__collins_rule_last_word, False)
+        )
+
+        # the head position only depends on the labels of a tree and its
+        # children, and these productions repeat a lot, so results are cached
+        self.__head_index_cache = {}
+
     def get_head(self, tree):
         """
         Compute the head of a mention, which is represented by its parse tree.
@@ -73,7 +147,7 @@ class HeadFinder:
                 head = tree[0]
             elif tree.height() == 2:
                 head = tree
-        elif label in ["NP", "NML"]:
+        elif label == "NP" or label == "NML":
             head = self.__get_head_for_np(tree)
         elif label in self.__nonterminals:
             head = self.__get_head_for_nonterminal(tree)
@@ -84,88 +158,115 @@ class HeadFinder:
         return head
 
     def __get_head_for_np(self, tree):
-        if self.__rule_cc(tree) is not None:
-            return self.__rule_cc(tree)
-        elif self.__collins_rule_nn(tree) is not None:
-            return self.__collins_rule_nn(tree)
-        elif self.__collins_rule_np(tree) is not None:
-            return self.get_head(self.__collins_rule_np(tree))
-        elif self.__collins_rule_nml(tree) is not None:
-            return self.get_head(self.__collins_rule_nml(tree))
-        elif self.__collins_rule_prn(tree) is not None:
-            return self.__collins_rule_prn(tree)
-        elif self.__collins_rule_cd(tree) is not None:
-            return self.__collins_rule_cd(tree)
-        elif self.__collins_rule_jj(tree) is not None:
-            return self.__collins_rule_jj(tree)
-        elif self.__collins_rule_last_word(tree) is not None:
-            return self.__collins_rule_last_word(tree)
+        # rules are tried in order, each rule is applied only once; for NP and
+        # NML children the head is computed recursively
+        # the rules mostly inspect the labels of the children, which are
+        # therefore only retrieved once
+        child_labels = [child.label() for child in tree]
+
+        for rule, recurse in self.__np_rules:
+            head = rule(tree, child_labels)
+            if head is not None:
+                if recurse:
+                    return self.get_head(head)
+                else:
+                    return head
 
     def __get_head_for_nonterminal(self, tree):
-        label = tree.label()
-        values, traverse_reversed = self.__nonterminal_rules[label]
-        if traverse_reversed:
-            to_traverse = reversed(tree)
+        child_labels = tuple(child.label() for child in tree)
+        key = (tree.label(), child_labels)
+
+        if key not in self.__head_index_cache:
+            self.__head_index_cache[key] = self.__get_head_index(*key)
+
+        index = self.__head_index_cache[key]
+
+        if index is None:
+            return None
+        elif child_labels[index] in self.__nonterminals:
+            return self.get_head(tree[index])
         else:
-            to_traverse = tree
-        for val in values:
-            for child in to_traverse:
-                label = child.label()
-                if val == "*" or label == val:
-                    if label in self.__nonterminals:
-                        return self.get_head(child)
-                    else:
-                        return child
-
-    def __rule_cc(self, tree):
-        if tree.label() == "NP":
-            for child in tree:
-                if child.label() == "CC":
-                    return child
-
-    def __collins_rule_pos(self, tree):
+            return tree[index]
+
+    def __get_head_index(self, label, child_labels):
+        priorities, traverse_reversed = self.__nonterminal_priorities[label]
+
+        indices = range(len(child_labels))
+        if traverse_reversed:
+            indices = reversed(indices)
+
+        if "*" in priorities:
+            return next(iter(indices))
+
+        # rules traversed from right to left only ever find the first value
+        # of the rule, since all values used to share one reversed iterator
+        if traverse_reversed:
+            for i in indices:
+                if priorities.get(child_labels[i]) == 0:
+                    return i
+
+            return None
+
+        head_index = None
+        best_priority = len(priorities)
+
+        for i in indices:
+            priority = priorities.get(child_labels[i], best_priority)
+            if priority < best_priority:
+                head_index = i
+                best_priority = priority
+
+                if priority == 0:
+                    break
+
+        return head_index
+
+    def __rule_cc(self, tree, child_labels):
+        if tree.label() == "NP" and "CC" in child_labels:
+            return tree[child_labels.index("CC")]
+
+    def __collins_rule_pos(self, tree, child_labels):
         if tree.pos()[-1][1] == "POS":
             return tree[-1]
 
-    def __collins_rule_nn(self, tree):
-        for i in range(len(tree)-1, -1, -1):
-            if re.match("NN|NNP|NNPS|JJR", tree[i].label()):
+    def __collins_rule_nn(self, tree, child_labels):
+        for i in range(len(child_labels)-1, -1, -1):
+            if child_labels[i].startswith(("NN", "JJR")):
                 return tree[i]
-            elif tree[i].label() == "NX":
+            elif child_labels[i] == "NX":
                 return self.get_head(tree[i])
 
-    def __collins_rule_np(self, tree):
-        for child in tree:
-            if child.label() == "NP":
-                return child
+    def __collins_rule_np(self, tree, child_labels):
+        if "NP" in child_labels:
+            return tree[child_labels.index("NP")]
 
-    def __collins_rule_nml(self, tree):
-        for child in tree:
-            if child.label() == "NML":
-                return child
+    def __collins_rule_nml(self, tree, child_labels):
+        if "NML" in child_labels:
+            return tree[child_labels.index("NML")]
 
-    def __collins_rule_prn(self, tree):
-        for child in tree:
-            if child.label() == "PRN":
-                return self.get_head(child[0])
+    def __collins_rule_prn(self, tree, child_labels):
+        if "PRN" in child_labels:
+            return self.get_head(tree[child_labels.index("PRN")][0])
 
-    def __collins_rule_cd(self, tree):
-        for i in range(len(tree)-1, -1, -1):
-            if re.match("CD", tree[i].label()):
+    def __collins_rule_cd(self, tree, child_labels):
+        for i in range(len(child_labels)-1, -1, -1):
+            if child_labels[i].startswith("CD"):
                 return tree[i]
 
-    def __collins_rule_jj(self, tree):
-        for i in range(len(tree)-1, -1, -1):
-            if re.match("JJ|JJS|RB", tree[i].label()):
+    def __collins_rule_jj(self, tree, child_labels):
+        for i in range(len(child_labels)-1, -1, -1):
+            if child_labels[i].startswith(("JJ", "RB")):
                 return tree[i]
-            elif tree[i].label() == "QP":
+            elif child_labels[i] == "QP":
                 return self.get_head(tree[i])
 
-    def __collins_rule_last_word(self, tree):
+    def __collins_rule_last_word(self, tree, child_labels):
         current_tree = tree[-1]
-        while current_tree.height() > 2:
+        while isinstance(current_tree[-1], nltk.Tree):
             current_tree = current_tree[-1]
 
+        return current_tree
+
     @staticmethod
     def adjust_head_for_nam(tokens, pos, ner_type, in_mention_span_old_head,
                             old_head):
@@ -199,39 +300,25 @@ class HeadFinder:
         if len(pos) == 0:
             return spans.Span(0, 0), "NOHEAD"
 
-        stop_regex = re.compile("CC|,|\.|:|;|V.*|IN|W.*|ADVP|NN$")
-
-        if re.match("ORG.*|GPE.*|FAC.*|NORP.*|PRODUCT|EVENT|MONEY|" +
-                    "WORK_OF_ART|LOC.*|LAW|LANGUAGE", ner_type):
-            start_regex = re.compile("NN(S)?|NNP(S)?")
-            stop_regex = re.compile("V.*|IN|W.*|ADVP|,|-LRB-")
-        elif ner_type == "PERSON":
-            start_regex = re.compile("NN(S)?|NNP(S)?")
-            stop_regex = re.compile("IN|CC|,|\.|:|;|V.*|W.*|-LRB-")
-        elif re.match("DATE|TIME", ner_type):
-            start_regex = re.compile("NN(S)?|NNP(S)?|CD")
-        elif re.match("ORDINAL", ner_type):
-            start_regex = re.compile("NN|JJ|RB")
-        elif re.match("CARDINAL", ner_type):
-            start_regex = re.compile("CD")
-        elif re.match("QUANTITY|PERCENT", ner_type):
-            start_regex = re.compile("CD|JJ|NN")
-        elif ner_type == "NONE":
-            start_regex = re.compile("NN(S)?|NNP(S)?|CD")
-        else:
+        rule = _get_head_adjustment_rule(ner_type)
+
+        if rule is None:
             logger.warning("No head adjustment rule defined for NER class " +
                            ner_type + ".")
             return in_mention_span_old_head, old_head
 
+        start_prefixes, (stop_prefixes, stop_tags) = rule
+
         head_start = -1
 
         position = 0
 
         for i in range(0, len(tokens)):
             position = i
-            if head_start == -1 and start_regex.match(pos[i]):
+            if head_start == -1 and pos[i].startswith(start_prefixes):
                 head_start = i
-            elif head_start >= 0 and stop_regex.match(pos[i]):
+            elif head_start >= 0 and (pos[i].startswith(stop_prefixes) or
+                                      pos[i] in stop_tags):
                 return spans.Span(head_start, i-1), tokens[head_start:i]
 
         if head_start == -1:
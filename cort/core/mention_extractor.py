@@ -1,7 +1,6 @@
 """ Functions for extracting and filtering mentions in documents. """
 
-from collections import defaultdict
-import re
+import nltk
 
 from cort.core import mentions
 from cort.core import spans
@@ -36,16 +35,33 @@ def extract_system_mentions(document, filter_mentions=True):
                        for span in __extract_system_mention_spans(document)]
 
     if filter_mentions:
-        for post_processor in [
-            post_process_same_head_largest_span,
-            post_process_embedded_head_largest_span,
-            post_process_by_head_pos,
-            post_process_by_nam_type,
-            post_process_weird,
-            post_process_appositions,
-            post_process_pleonastic_pronoun
-        ]:
-            system_mentions = post_processor(system_mentions)
+        system_mentions = post_process_same_head_largest_span(system_mentions)
+
+        # the remaining filters keep the order of mentions, so they are
+        # fused into two passes (equivalent to applying
+        # post_process_embedded_head_largest_span, post_process_by_head_pos,
+        # post_process_by_nam_type, post_process_weird,
+        # post_process_appositions and post_process_pleonastic_pronoun in
+        # this order)
+        min_begin_for_head_end = __get_min_begin_for_head_end(system_mentions)
+
+        system_mentions = [
+            mention for mention in system_mentions
+            if not __has_embedded_head(mention, min_begin_for_head_end)
+            and not __has_adjectival_head(mention)
+            and not __is_numeric_name(mention)
+            and not __is_weird(mention)
+        ]
+
+        appos = [mention for mention in system_mentions
+                 if mention.attributes["is_apposition"]]
+
+        system_mentions = [
+            mention for mention in system_mentions
+            if (mention.attributes["type"] == "PRO"
+                or not __is_embedded_in_apposition(mention, appos))
+            and not __is_pleonastic(mention)
+        ]
 
     seen = set()
 
@@ -73,46 +89,46 @@ def __extract_system_mention_spans(document):
 
         in_sentence_spans = __extract_mention_spans_for_sentence(
             sentence_tree,
+            document.pos[sentence_span.begin:sentence_span.end+1],
             document.ner[sentence_span.begin:sentence_span.end+1])
 
         mention_spans += [spans.Span(sentence_span.begin + span.begin,
                                      sentence_span.begin + span.end)
                           for span in in_sentence_spans]
 
-    return sorted(mention_spans)
+    # spans are sorted within each sentence, and sentences are in order
+    return mention_spans
+
 
+def __extract_mention_spans_for_sentence(sentence_tree, sentence_pos,
+                                         sentence_ner):
+    mention_spans = set(__get_in_tree_spans(sentence_tree))
+    mention_spans.update(__get_span_from_ner(sentence_pos, sentence_ner))
 
-def __extract_mention_spans_for_sentence(sentence_tree, sentence_ner):
-    return sorted(list(set(
-        [__get_in_tree_span(subtree) for subtree
-            in sentence_tree.subtrees(__tree_filter)]
-        + __get_span_from_ner(
-            [pos[1] for pos in sentence_tree.pos()], sentence_ner)
-    )))
+    return sorted(mention_spans)
 
 
 def __extract_mention_spans_from_tree(sentence_tree):
-    mention_spans = []
+    return sorted(__get_in_tree_spans(sentence_tree))
 
-    for subtree in sentence_tree.subtrees(__tree_filter):
-        mention_spans.append(__get_in_tree_span(subtree))
 
-    return sorted(mention_spans)
+__mention_labels = frozenset(["NP", "PRP$"])
 
 
 def __tree_filter(tree):
-    return tree.label() == "NP" or tree.label() == "PRP$"
+    return tree.label() in __mention_labels
 
 
 def __get_span_from_ner(pos, ner):
     i = 0
     spans_from_ner = []
-    while i < len(ner):
+    length = len(ner)
+    while i < length:
         current_tag = ner[i]
         if current_tag != "NONE":
             start = i
 
-            while i+1 < len(ner) and ner[i+1] != "NONE" and ner[i] == ner[i+1]:
+            while i+1 < length and ner[i+1] == current_tag:
                 i += 1
 
             if i+1 < len(pos) and pos[i+1] == "POS":
@@ -122,26 +138,32 @@ def __get_span_from_ner(pos, ner):
 
         i += 1
 
-    return sorted(spans_from_ner)
+    # spans are found from left to right and do not overlap, so they are
+    # already sorted
+    return spans_from_ner
 
 
-def __get_in_tree_span(parented_tree):
-    start = 0
+def __get_in_tree_spans(sentence_tree):
+    # compute spans of all subtrees accepted by __tree_filter in one
+    # traversal, instead of walking up to the root for every subtree
+    in_tree_spans = []
+    __collect_in_tree_spans(sentence_tree, 0, in_tree_spans)
+    return in_tree_spans
 
-    current_tree = parented_tree
 
-    while current_tree.parent() is not None:
-        for child in current_tree.parent():
-            if child == current_tree:
-                break
-            else:
-                start += len(child.leaves())
+def __collect_in_tree_spans(tree, start, in_tree_spans):
+    end = start
 
-        current_tree = current_tree.parent()
+    for child in tree:
+        if isinstance(child, nltk.Tree):
+            end = __collect_in_tree_spans(child, end, in_tree_spans)
+        else:
+            end += 1
 
-    end = start + len(parented_tree.leaves()) - 1
+    if __tree_filter(tree):
+        in_tree_spans.append(spans.Span(start, end - 1))
 
-    return spans.Span(start, end)
+    return end
 
 
 def post_process_by_head_pos(system_mentions):
@@ -156,9 +178,7 @@ def post_process_by_head_pos(system_mentions):
     return sorted(
         [mention for mention
             in system_mentions
-            if not re.match("^(JJ)",
-                            mention.attributes["pos"][
-                                mention.attributes["head_index"]])]
+            if not __has_adjectival_head(mention)]
     )
 
 
@@ -175,9 +195,7 @@ def post_process_by_nam_type(system_mentions):
     return sorted(
         [mention for mention
             in system_mentions
-            if mention.attributes["type"] != "NAM" or
-            mention.attributes["ner"][mention.attributes["head_index"]] not in
-            ["QUANTITY", "CARDINAL", "ORDINAL", "MONEY", "PERCENT"]]
+            if not __is_numeric_name(mention)]
     )
 
 
@@ -194,13 +212,40 @@ def post_process_weird(system_mentions):
     return sorted(
         [mention for mention
          in system_mentions
-         if " ".join(mention.attributes["tokens"]).lower() not in
-         ["mm", "hmm", "ahem", "um"]
-         and " ".join(mention.attributes["tokens"]) != "US"
-         and " ".join(mention.attributes["tokens"]) != "U.S."]
+         if not __is_weird(mention)]
     )
 
 
+def __has_adjectival_head(mention):
+    return mention.attributes["pos"][
+        mention.attributes["head_index"]].startswith("JJ")
+
+
+def __is_numeric_name(mention):
+    return (mention.attributes["type"] == "NAM" and
+            mention.attributes["ner"][mention.attributes["head_index"]] in
+            {"QUANTITY", "CARDINAL", "ORDINAL", "MONEY", "PERCENT"})
+
+
+def __is_weird(mention):
+    if __get_tokens_as_lowercase_string(mention) in \
+            {"mm", "hmm", "ahem", "um"}:
+        return True
+
+    return " ".join(mention.attributes["tokens"]) in {"US", "U.S."}
+
+
+def __get_tokens_as_lowercase_string(mention):
+    # mentions created via Mention.from_document carry this attribute, but
+    # mentions passed to the public post-processing functions may not
+    attributes = mention.attributes
+
+    if "tokens_as_lowercase_string" in attributes:
+        return attributes["tokens_as_lowercase_string"]
+    else:
+        return " ".join(attributes["tokens"]).lower()
+
+
 def post_process_pleonastic_pronoun(system_mentions):
     """ Removes pleonastic it and you.
 
@@ -214,28 +259,33 @@ def post_process_pleonastic_pronoun(system_mentions):
     Returns:
         list(Mention): the filtered list of mentions.
     """
-    filtered = []
+    return sorted(
+        [mention for mention
+         in system_mentions
+         if not __is_pleonastic(mention)]
+    )
 
-    for mention in system_mentions:
-        if " ".join(mention.attributes["tokens"]).lower() == "it":
-            context_two = mention.get_context(2)
-            context_three = mention.get_context(3)
 
-            if context_two is not None:
-                if context_two[-1] == "that":
-                    continue
+def __is_pleonastic(mention):
+    tokens = __get_tokens_as_lowercase_string(mention)
 
-            if context_three is not None:
-                if context_three[-1] == "that":
-                    continue
+    if tokens == "it":
+        context_two = mention.get_context(2)
+        context_three = mention.get_context(3)
 
-        if " ".join(mention.attributes["tokens"]).lower() == "you":
-            if mention.get_context(1) == ["know"]:
-                continue
+        if context_two is not None:
+            if context_two[-1] == "that":
+                return True
 
-        filtered.append(mention)
+        if context_three is not None:
+            if context_three[-1] == "that":
+                return True
 
-    return sorted(filtered)
+    if tokens == "you":
+        if mention.get_context(1) == ["know"]:
+            return True
+
+    return False
 
 
 def post_process_same_head_largest_span(system_mentions):
@@ -247,14 +297,19 @@ def post_process_same_head_largest_span(system_mentions):
     Returns:
         list(Mention): the filtered list of mentions.
     """
-    head_span_to_mention = defaultdict(list)
+    # for each head, keep the largest mention (among mentions of the same
+    # length, keep the one which is greatest according to mention order)
+    head_span_to_mention = {}
 
     for mention in system_mentions:
-        head_span_to_mention[mention.attributes["head_span"]].append(
-            (mention.span.end - mention.span.begin, mention))
+        head_span = mention.attributes["head_span"]
+        candidate = (mention.span.end - mention.span.begin, mention)
+
+        if (head_span not in head_span_to_mention
+                or head_span_to_mention[head_span] < candidate):
+            head_span_to_mention[head_span] = candidate
 
-    return sorted([sorted(head_span_to_mention[head_span])[-1][1]
-                   for head_span in head_span_to_mention])
+    return sorted([mention for _, mention in head_span_to_mention.values()])
 
 
 def post_process_embedded_head_largest_span(system_mentions):
@@ -266,26 +321,31 @@ def post_process_embedded_head_largest_span(system_mentions):
     Returns:
         list(Mention): the filtered list of mentions.
     """
-    map_for_heads = {}
+    min_begin_for_head_end = __get_min_begin_for_head_end(system_mentions)
 
-    for mention in system_mentions:
-        head_span = mention.attributes["head_span"]
-        if head_span.end not in map_for_heads:
-            map_for_heads[head_span.end] = []
+    return sorted(
+        [mention for mention
+         in system_mentions
+         if not __has_embedded_head(mention, min_begin_for_head_end)]
+    )
 
-        map_for_heads[head_span.end].append(head_span.begin)
 
-    post_processed_mentions = []
+def __get_min_begin_for_head_end(system_mentions):
+    # for each head end, only the smallest head begin matters
+    min_begin_for_head_end = {}
 
     for mention in system_mentions:
         head_span = mention.attributes["head_span"]
-        head_begins = sorted(map_for_heads[head_span.end])
-        if head_begins[0] < head_span.begin:
-            continue
-        else:
-            post_processed_mentions.append(mention)
+        if (head_span.end not in min_begin_for_head_end
+                or head_span.begin < min_begin_for_head_end[head_span.end]):
+            min_begin_for_head_end[head_span.end] = head_span.begin
 
-    return sorted(post_processed_mentions)
+    return min_begin_for_head_end
+
+
+def __has_embedded_head(mention, min_begin_for_head_end):
+    head_span = mention.attributes["head_span"]
+    return min_begin_for_head_end[head_span.end] < head_span.begin
 
 
 def post_process_appositions(system_mentions):
@@ -297,24 +357,32 @@ def post_process_appositions(system_mentions):
     Returns:
         list(Mention): the filtered list of mentions.
     """
-    appos = [mention for mention
-             in system_mentions if mention.attributes["is_apposition"]]
+    appos = sorted([mention for mention
+                    in system_mentions if mention.attributes["is_apposition"]])
 
-    post_processed_mentions = []
+    # pronouns are always kept, so only other mentions need to be checked
+    return sorted(
+        [mention for mention in system_mentions
+         if mention.attributes["type"] == "PRO"
+         or not __is_embedded_in_apposition(mention, appos)]
+    )
 
-    for mention in system_mentions:
-        span = mention.span
-        embedded_in_appo = False
-        for appo in appos:
-            appo_span = appo.span
-            if appo_span.embeds(span) and appo_span != span:
-                if len(appo.attributes["parse_tree"]) == 2:
-                    embedded_in_appo = True
-                elif (mention.attributes["parse_tree"] in
-                        appo.attributes["parse_tree"]):
-                    embedded_in_appo = True
-
-        if mention.attributes["type"] == "PRO" or not embedded_in_appo:
-            post_processed_mentions.append(mention)
-
-    return sorted(post_processed_mentions)
+
+def __is_embedded_in_apposition(mention, appos):
+    span = mention.span
+
+    for appo in appos:
+        appo_span = appo.span
+
+        # appositions are sorted, no later one can embed the mention
+        if appo_span.begin > span.begin:
+            break
+
+        if appo_span.embeds(span) and appo_span != span:
+            if len(appo.attributes["parse_tree"]) == 2:
+                return True
+            elif (mention.attributes["parse_tree"] in
+                    appo.attributes["parse_tree"]):
+                return True
+
+    return False
@@ -1,7 +1,6 @@
 """ Compute attributes of mentions. """
 
-import re
-
+import nltk
 from nltk.corpus import wordnet as wn
 
 from cort.core import external_data
@@ -12,6 +11,53 @@ from cort.core import spans
 __author__ = 'smartschat'
 
 
+# head finders only keep a cache of head positions by production, so one
+# instance (and its cache, which is never cleared) is shared by all mentions
+# in the process
+__head_finder = head_finders.HeadFinder()
+
+# results of WordNet lookups, by head
+__wordnet_semantic_class_cache = {}
+__wordnet_gender_cache = {}
+
+# WordNet lemmas which determine semantic class and gender when found among
+# the hypernyms of a head ("person" ends the search for gender)
+__lemma_to_semantic_class = {"person": "PERSON", "object": "OBJECT"}
+__lemma_to_gender = {"man": "MALE", "male": "MALE", "woman": "FEMALE",
+                     "female": "FEMALE", "person": None, "entity": "NEUTRAL"}
+
+# mention types, by part-of-speech tag and named entity tag of the head
+__type_for_pos_and_ner = {}
+
+__numeric_ner_prefixes = ("DATE", "TIME", "NUMBER", "QUANTITY", "MONEY",
+                          "PERCENT")
+
+# word lists for gender, fine types and citation forms
+__male_titles = {"mr", "mr."}
+__female_titles = {"miss", "miss.", "ms", "ms.", "mrs", "mrs."}
+__definite_determiners = {"the", "this", "that", "these", "those", "my",
+                          "your", "his", "her", "its", "our", "their"}
+__nominative_pronouns = {"i", "you", "he", "she", "it", "we", "they"}
+__accusative_pronouns = {"me", "you", "him", "her", "it", "us", "them"}
+__reflexive_pronouns = {"myself", "yourself", "yourselves", "himself",
+                        "herself", "itself", "ourselves", "themselves"}
+__possessive_pronouns = {"mine", "yours", "his", "hers", "its", "ours",
+                         "theirs"}
+__possessive_adjectives = {"my", "your", "his", "her", "its", "our", "their"}
+
+__pronoun_to_citation_form = {
+    "he": "he", "him": "he", "himself": "he", "his": "he",
+    "she": "she", "her": "she", "herself": "she", "hers": "she",
+    "it": "it", "itself": "it", "its": "it",
+    "they": "they", "them": "they", "themselves": "they", "theirs": "they",
+    "their": "they",
+    "i": "i", "me": "i", "myself": "i", "mine": "i", "my": "i",
+    "you": "you", "yourself": "you", "yourselves": "you", "yours": "you",
+    "your": "you",
+    "we": "we", "us": "we", "ourselves": "we", "ours": "we", "our": "we",
+}
+
+
 def compute_number(attributes):
     """ Compute the number of a mention.
 
@@ -54,7 +100,9 @@ def compute_gender(attributes):
     Args:
         attributes (dict(str, object)): Attributes of the mention, must contain
             values for "type", "head", "head_index" and, if the mention is a
-            pronoun, "citation_form".
+            pronoun, "citation_form". If present, the values for "number",
+            "semantic_class" and "head_as_lowercase_string" are used instead
+            of computing them again.
 
     Returns:
         str: the number of the mention -- one of UNKNOWN, MALE, FEMALE,
@@ -62,9 +110,13 @@ def compute_gender(attributes):
     """
     gender = "NEUTRAL"
     head_index = attributes["head_index"]
-    gender_data = external_data.GenderData.get_instance()
 
-    if compute_number(attributes) == "PLURAL":
+    if "number" in attributes:
+        number = attributes["number"]
+    else:
+        number = compute_number(attributes)
+
+    if number == "PLURAL":
         gender = "PLURAL"
     elif attributes["type"] == "PRO":
         if attributes["citation_form"] == "he":
@@ -76,23 +128,30 @@ def compute_gender(attributes):
         elif attributes["citation_form"] in ["you", "we", "they"]:
             gender = "PLURAL"
     elif attributes["type"] == "NAM":
-        if re.match(r"^mr(\.)?$", attributes["tokens"][0].lower()):
+        if attributes["tokens"][0].lower() in __male_titles:
             gender = "MALE"
-        elif re.match(r"^(miss|ms|mrs)(\.)?$",
-                      attributes["tokens"][0].lower()):
+        elif attributes["tokens"][0].lower() in __female_titles:
             gender = "FEMALE"
-        elif not re.match(r"(PERSON|NONE)", attributes["ner"][head_index]):
+        elif not attributes["ner"][head_index].startswith(
+                ("PERSON", "NONE")):
             gender = "NEUTRAL"
-        elif gender_data.look_up(attributes):
-            gender = gender_data.look_up(attributes)
+        else:
+            gender = (external_data.GenderData.get_instance().look_up(
+                attributes) or gender)
     elif attributes["type"] == "NOM":
-        if __wordnet_lookup_gender(" ".join(attributes["head"])):
-            gender = __wordnet_lookup_gender(" ".join(attributes["head"]))
-        elif gender_data.look_up(attributes):
-            gender = gender_data.look_up(attributes)
+        gender = (__wordnet_lookup_gender(__head_as_string(attributes)) or
+                  external_data.GenderData.get_instance().look_up(
+                      attributes) or
+                  gender)
+
+    if gender == "NEUTRAL":
+        if "semantic_class" in attributes:
+            semantic_class = attributes["semantic_class"]
+        else:
+            semantic_class = compute_semantic_class(attributes)
 
-    if gender == "NEUTRAL" and compute_semantic_class(attributes) == "PERSON":
-        gender = "UNKNOWN"
+        if semantic_class == "PERSON":
+            gender = "UNKNOWN"
 
     return gender
 
@@ -103,7 +162,9 @@ def compute_semantic_class(attributes):
     Args:
         attributes (dict(str, object)): Attributes of the mention, must contain
             values for "type", "head", "head_index" and, if the mention is a
-            pronoun, "citation_form".
+            pronoun, "citation_form". If present, the value for
+            "head_as_lowercase_string" is used instead of joining the head
+            again.
 
     Returns:
         str: the semantic class of the mention -- one of PERSON, OBJECT,
@@ -125,47 +186,54 @@ def compute_semantic_class(attributes):
         ner_tag = attributes["ner"][head_index]
         if ner_tag == "PERSON":
             semantic_class = "PERSON"
-        elif re.match("DATE|TIME|NUMBER|QUANTITY|MONEY|PERCENT", ner_tag):
+        elif ner_tag.startswith(__numeric_ner_prefixes):
             semantic_class = "NUMERIC"
         else:
             semantic_class = "OBJECT"
     # wordnet lookup
-    elif (attributes["type"] == "NOM" and
-            __wordnet_lookup_semantic_class(" ".join(attributes["head"]))):
-        semantic_class = __wordnet_lookup_semantic_class(
-            " ".join(attributes["head"]))
+    elif attributes["type"] == "NOM":
+        semantic_class = (__wordnet_lookup_semantic_class(
+            __head_as_string(attributes)) or semantic_class)
 
     return semantic_class
 
 
-def __wordnet_lookup_semantic_class(head):
-    synsets = wn.synsets(head)
+def __head_as_string(attributes):
+    # WordNet lookups ignore case, so the lowercased head computed when
+    # creating the mention can be reused
+    if "head_as_lowercase_string" in attributes:
+        return attributes["head_as_lowercase_string"]
+    else:
+        return " ".join(attributes["head"]).lower()
 
-    while synsets:
-        lemma_name = synsets[0].lemma_names()[0]
 
-        if lemma_name == "person":
-            return "PERSON"
-        elif lemma_name == "object":
-            return "OBJECT"
+def __wordnet_lookup_semantic_class(head):
+    # heads repeat a lot, so results of the (slow) WordNet lookups are cached
+    if head not in __wordnet_semantic_class_cache:
+        __wordnet_semantic_class_cache[head] = __walk_hypernyms(
+            head, __lemma_to_semantic_class)
 
-        synsets = synsets[0].hypernyms()
+    return __wordnet_semantic_class_cache[head]
 
 
 def __wordnet_lookup_gender(head):
+    if head not in __wordnet_gender_cache:
+        __wordnet_gender_cache[head] = __walk_hypernyms(
+            head, __lemma_to_gender)
+
+    return __wordnet_gender_cache[head]
+
+
+def __walk_hypernyms(head, lemma_to_value):
+    # follow the first hypernyms of the first synset of head until reaching
+    # a synset whose first lemma is a key of lemma_to_value
     synsets = wn.synsets(head)
 
     while synsets:
         lemma_name = synsets[0].lemma_names()[0]
 
-        if lemma_name == "man" or lemma_name == "male":
-            return "MALE"
-        elif lemma_name == "woman" or lemma_name == "female":
-            return "FEMALE"
-        elif lemma_name == "person":
-            return
-        elif lemma_name == "entity":
-            return "NEUTRAL"
+        if lemma_name in lemma_to_value:
+            return lemma_to_value[lemma_name]
 
         synsets = synsets[0].hypernyms()
 
@@ -188,19 +256,29 @@ def is_apposition(attributes):
             return (tree[0].label() == "NP" and
                     tree[1].label() == "NP" and
                     __head_pos_starts_with(tree[1], "NNP"))
+        # check the first part-of-speech tags of the children before
+        # computing their heads, since this is much cheaper
         elif len(tree) == 3:
             return (tree[0].label() == "NP" and
                     tree[1].label() == "," and
                     tree[2].label() == "NP" and
-                    __any_child_head_starts_with(tree, "NNP") and
-                    "DT" in set([child.pos()[0][1] for child in tree]))
+                    any(__first_pos(child) == "DT" for child in tree) and
+                    __any_child_head_starts_with(tree, "NNP"))
         elif len(tree) == 4:
             return (tree[0].label() == "NP" and
                     tree[1].label() == "," and
                     tree[2].label() == "NP" and
                     tree[3].label() == "," and
-                    __any_child_head_starts_with(tree, "NNP") and
-                    "DT" in set([child.pos()[0][1] for child in tree]))
+                    any(__first_pos(child) == "DT" for child in tree) and
+                    __any_child_head_starts_with(tree, "NNP"))
+
+
+def __first_pos(tree):
+    # part-of-speech tag of the first leaf, without traversing the whole tree
+    while isinstance(tree[0], nltk.Tree):
+        tree = tree[0]
+
+    return tree.label()
 
 
 def __any_child_head_starts_with(tree, pos_tag):
@@ -212,8 +290,7 @@ def __any_child_head_starts_with(tree, pos_tag):
 
 
 def __head_pos_starts_with(tree, pos_tag):
-    head_finder = head_finders.HeadFinder()
-    return head_finder.get_head(tree).pos()[0][1].startswith(pos_tag)
+    return __head_finder.get_head(tree).pos()[0][1].startswith(pos_tag)
 
 
 def compute_head_information(attributes):
@@ -229,13 +306,15 @@ def compute_head_information(attributes):
     """
     mention_subtree = attributes["parse_tree"]
 
-    head_finder = head_finders.HeadFinder()
     head_index = 0
     head = [attributes["tokens"][0]]
 
-    if len(mention_subtree.leaves()) == len(attributes["tokens"]):
-        head_tree = head_finder.get_head(mention_subtree)
-        head_index = get_head_index(head_tree, mention_subtree.pos())
+    # the leaves of the tree with their part-of-speech tags, computed once
+    leaves_with_pos = mention_subtree.pos()
+
+    if len(leaves_with_pos) == len(attributes["tokens"]):
+        head_tree = __head_finder.get_head(mention_subtree)
+        head_index = get_head_index(head_tree, leaves_with_pos)
         head = [head_tree[0]]
 
     in_mention_span = spans.Span(head_index, head_index)
@@ -267,9 +346,10 @@ def compute_head_information(attributes):
         else:
             start = 0
             for child in mention_subtree:
+                child_length = len(child.leaves())
                 if __head_pos_starts_with(child, "NNP"):
                     end = min(
-                        [start + len(child.leaves()),
+                        [start + child_length,
                          len(attributes["tokens"])])
                     head_index = end - 1
                     in_mention_span, head = \
@@ -280,7 +360,7 @@ def compute_head_information(attributes):
                             in_mention_span,
                             head)
                     break
-                start += len(child.leaves())
+                start += child_length
 
     return head, in_mention_span, head_index
 
@@ -307,7 +387,8 @@ def get_relevant_subtree(span, document):
         in_sentence_span.begin, in_sentence_span.end+1)
     mention_subtree = sentence_tree[spanning_leaves]
 
-    if mention_subtree in sentence_tree.leaves():
+    # the span consists of a single token, we obtained its leaf
+    if not isinstance(mention_subtree, nltk.Tree):
         mention_subtree = sentence_tree[spanning_leaves[:-2]]
 
     return mention_subtree
@@ -332,22 +413,23 @@ def get_grammatical_function(attributes):
     else:
         parent_label = parent.label()
 
-        if re.match(r"^(S|FRAG)", parent_label):
+        if parent_label.startswith(("S", "FRAG")):
             return "SUBJECT"
-        elif re.match(r"VP", parent_label):
+        elif parent_label.startswith("VP"):
             return "OBJECT"
         else:
             return "OTHER"
 
 
 def get_head_index(head_with_pos, all_leaves):
-    head_index = -1
+    head = head_with_pos[0]
 
-    for i in range(0, len(all_leaves)):
-        if head_with_pos[0] == all_leaves[i][0]:
-            head_index = i
+    # the last matching leaf is the head, so search from the end
+    for i in range(len(all_leaves) - 1, -1, -1):
+        if all_leaves[i][0] == head:
+            return i
 
-    return head_index
+    return -1
 
 
 def get_type(attributes):
@@ -361,9 +443,18 @@ def get_type(attributes):
         str: The mention type, one of NAM (proper name), NOM (common noun),
         PRO (pronoun), DEM (demonstrative pronoun) and VRB (verb).
     """
-    pos = attributes["pos"][attributes["head_index"]]
-    head_ner = attributes["ner"][attributes["head_index"]]
+    key = (attributes["pos"][attributes["head_index"]],
+           attributes["ner"][attributes["head_index"]])
+
+    # the type only depends on the head's tag pair, and there are few such
+    # pairs, so types are computed once per pair
+    if key not in __type_for_pos_and_ner:
+        __type_for_pos_and_ner[key] = __compute_type(*key)
+
+    return __type_for_pos_and_ner[key]
 
+
+def __compute_type(pos, head_ner):
     if pos.startswith("NNP"):
         return "NAM"
     elif head_ner != "NONE":
@@ -374,8 +465,6 @@ def get_type(attributes):
         return "DEM"
     elif pos.startswith("VB"):
         return "VRB"
-    elif pos.startswith("NN"):
-        return "NOM"
     else:
         return "NOM"
 
@@ -404,28 +493,24 @@ def get_fine_type(attributes):
     start_pos = attributes["pos"][0]
 
     if coarse_type == "NOM":
-        if re.match("^(the|this|that|these|those|my|your|his|her|its|our|" +
-                    "their)$", start_token.lower()):
+        if start_token.lower() in __definite_determiners:
             return "DEF"
-        elif re.match("^NNP$", start_pos):  # also matches NNPS!
+        elif start_pos == "NNP":
             return "DEF"
         else:
             return "INDEF"
     elif coarse_type == "PRO":
-        if re.match("^(i|you|he|she|it|we|they)$", start_token.lower()):
+        start_token = start_token.lower()
+
+        if start_token in __nominative_pronouns:
             return "PERS_NOM"
-        elif re.match("^(me|you|him|her|it|us|you|them)$",
-                      start_token.lower()):
+        elif start_token in __accusative_pronouns:
             return "PERS_ACC"
-        elif re.match("^(myself|yourself|yourselves|himself|herself|itself|" +
-                      "ourselves|themselves)$", start_token.lower()):
+        elif start_token in __reflexive_pronouns:
             return "REFL"
-        elif start_pos == "PRP" and re.match("^(mine|yours|his|hers|its|" +
-                                             "ours|theirs|)$",
-                                             start_token.lower()):
+        elif start_pos == "PRP" and start_token in __possessive_pronouns:
             return "POSS"
-        elif start_pos == "PRP$" and re.match("^(my|your|his|her|its|our|" +
-                                              "their)$", start_token.lower()):
+        elif start_pos == "PRP$" and start_token in __possessive_adjectives:
             return "POSS_ADJ"
 
 
@@ -442,18 +527,4 @@ def get_citation_form(attributes):
     """
     pronoun = attributes["tokens"][0]
 
-    pronoun = pronoun.lower()
-    if re.match("^(he|him|himself|his)$",  pronoun):
-        return "he"
-    elif re.match("^(she|her|herself|hers|her)$",  pronoun):
-        return "she"
-    elif re.match("^(it|itself|its)$",  pronoun):
-        return "it"
-    elif re.match("^(they|them|themselves|theirs|their)$",  pronoun):
-        return "they"
-    elif re.match("^(i|me|myself|mine|my)$",  pronoun):
-        return "i"
-    elif re.match("^(you|yourself|yourselves|yours|your)$",  pronoun):
-        return "you"
-    elif re.match("^(we|us|ourselves|ours|our)$",  pronoun):
-        return "we"
+    return __pronoun_to_citation_form.get(pronoun.lower())
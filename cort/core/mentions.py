@@ -7,7 +7,7 @@ from cort.core import spans
 __author__ = 'smartschat'
 
 
-class Mention:
+class Mention(object):
     """ A mention is an expression in a document which is potentially referring.
 
     Attributes:
@@ -78,6 +78,9 @@ class Mention:
                   found by the mention extractor),
 
     """
+    # there are many mentions in a corpus, so no per-instance dict is used
+    __slots__ = ("document", "span", "attributes", "_hash")
+
     def __init__(self, document, span, attributes):
         """ Initialize a mention in a document.
 
@@ -92,6 +95,9 @@ class Mention:
         self.span = span
         self.attributes = attributes
 
+        # mentions are hashed very often, so the hash is computed only once
+        self._hash = None
+
     @staticmethod
     def dummy_from_document(document):
 
@@ -159,6 +165,12 @@ class Mention:
         )
         attributes["head_index"] = head_index
 
+        attributes["head_as_lowercase_string"] = " ".join(attributes[
+            "head"]).lower()
+
+        attributes["tokens_as_lowercase_string"] = " ".join(attributes[
+            "tokens"]).lower()
+
         attributes["type"] = mention_property_computer.get_type(attributes)
         attributes["fine_type"] = mention_property_computer.get_fine_type(
             attributes)
@@ -168,19 +180,15 @@ class Mention:
                 mention_property_computer.get_citation_form(
                     attributes)
 
+        # gender depends on number and semantic class, which are therefore
+        # computed first
         attributes["number"] = \
             mention_property_computer.compute_number(attributes)
-        attributes["gender"] = \
-            mention_property_computer.compute_gender(attributes)
-
         attributes["semantic_class"] = \
             mention_property_computer.compute_semantic_class(attributes)
 
-        attributes["head_as_lowercase_string"] = " ".join(attributes[
-            "head"]).lower()
-
-        attributes["tokens_as_lowercase_string"] = " ".join(attributes[
-            "tokens"]).lower()
+        attributes["gender"] = \
+            mention_property_computer.compute_gender(attributes)
 
         dep_tree = document.dep[i]
 
@@ -266,14 +274,30 @@ class Mention:
         return not self.__eq__(other)
 
     def __hash__(self):
-        if self.document is None:
-            return hash((self.span.begin, self.span.end))
-        elif self.span is None:
-            return hash(self.document.identifier)
-        else:
-            return hash((self.document.identifier,
-                         self.span.begin,
-                         self.span.end))
+        if self._hash is None:
+            if self.document is None:
+                self._hash = hash((self.span.begin, self.span.end))
+            elif self.span is None:
+                self._hash = hash(self.document.identifier)
+            else:
+                self._hash = hash((self.document.identifier,
+                                   self.span.begin,
+                                   self.span.end))
+
+        return self._hash
+
+    def __getstate__(self):
+        # string hashes differ between processes, so the cached hash must
+        # not be pickled
+        return {"document": self.document,
+                "span": self.span,
+                "attributes": self.attributes}
+
+    def __setstate__(self, state):
+        self.document = state["document"]
+        self.span = state["span"]
+        self.attributes = state["attributes"]
+        self._hash = None
 
     def __str__(self):
         return (repr(self.document) +
@@ -1,18 +1,20 @@
 """ Manage spans in documents. """
 
-from cort.core import mixins
-
 
 __author__ = 'smartschat'
 
 
-class Span(mixins.ComparableMixin):
+class Span(object):
     """ Manage and compare spans in documents.
 
     Attributes:
         begin (int): The begin of the span.
         end (int): The end of the span (inclusive).
     """
+    # spans are created for every mention and head, so no per-instance dict
+    # is used
+    __slots__ = ("begin", "end", "_key")
+
     def __init__(self, begin, end):
         """ Initialize a span from a begin and an end position.
 
@@ -23,6 +25,11 @@ class Span(mixins.ComparableMixin):
         self.begin = begin
         self.end = end
 
+        # spans are compared and hashed very often, so begin and end are
+        # packed into one integer which respects the order of spans (this
+        # requires the absolute value of end to be smaller than 2^31)
+        self._key = (begin << 32) + end
+
     def __str__(self):
         return "(" + str(self.begin) + ", " + str(self.end) + ")"
 
@@ -40,14 +47,22 @@ class Span(mixins.ComparableMixin):
         Returns:
             True if this span is less than other, False otherwise.
         """
-        if self.begin < other.begin:
-            return True
-        elif self.begin > other.begin:
-            return False
-        elif self.end < other.end:
-            return True
-        else:
-            return False
+        return self._key < other._key
+
+    def __le__(self, other):
+        return self._key <= other._key
+
+    def __gt__(self, other):
+        return self._key > other._key
+
+    def __ge__(self, other):
+        return self._key >= other._key
+
+    def __eq__(self, other):
+        return isinstance(other, Span) and self._key == other._key
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
 
     def embeds(self, other):
         """ Check whether this span embeds another span.
@@ -61,7 +76,7 @@ class Span(mixins.ComparableMixin):
         return self.begin <= other.begin and self.end >= other.end
 
     def __hash__(self):
-        return hash((self.begin, self.end))
+        return hash(self._key)
 
     @staticmethod
     def parse(span_string):
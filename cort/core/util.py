@@ -1,8 +1,17 @@
 """ Utility functions. """
 
+import re
+
+
 __author__ = 'smartschat'
 
 
+# company designators, which are ignored when computing acronyms for the
+# alias features
+company_designator = re.compile(
+    r'assoc|bros|co|coop|corp|devel|inc|llc|ltd\.?')
+
+
 def clean_via_pos(tokens, pos):
     """ Clean a list of tokens according to their part-of-speech tags.
 
@@ -67,8 +67,9 @@ def extract_substructures(doc):
     # iterate over mentions
     for i, ana in enumerate(doc.system_mentions):
 
-        # iterate in reversed order over candidate antecedents
-        for ante in sorted(doc.system_mentions[:i], reverse=True):
+        # iterate in reversed order over candidate antecedents (system
+        # mentions are sorted, so there is no need to sort them again)
+        for ante in reversed(doc.system_mentions[:i]):
             substructure.append((ana, ante))
 
     return [substructure]
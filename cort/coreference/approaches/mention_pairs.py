@@ -66,8 +66,9 @@ def extract_training_substructures(doc):
         if not ana.attributes["annotated_set_id"]:
             continue
 
-        # iterate in reversed order over candidate antecedents
-        for ante in sorted(doc.system_mentions[1:i], reverse=True):
+        # iterate in reversed order over candidate antecedents (system
+        # mentions are sorted, so there is no need to sort them again)
+        for ante in reversed(doc.system_mentions[1:i]):
             substructures.append([(ana, ante)])
 
             if ana.is_coreferent_with(ante):
@@ -102,8 +103,9 @@ def extract_testing_substructures(doc):
     # iterate over mentions
     for i, ana in enumerate(doc.system_mentions):
 
-        # iterate in reversed order over candidate antecedents
-        for ante in sorted(doc.system_mentions[1:i], reverse=True):
+        # iterate in reversed order over candidate antecedents (system
+        # mentions are sorted, so there is no need to sort them again)
+        for ante in reversed(doc.system_mentions[1:i]):
             substructures.append([(ana, ante)])
 
     return substructures
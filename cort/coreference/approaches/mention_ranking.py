@@ -77,8 +77,9 @@ def extract_substructures(doc):
     for i, ana in enumerate(doc.system_mentions):
         for_anaphor_arcs = []
 
-        # iterate in reversed order over candidate antecedents
-        for ante in sorted(doc.system_mentions[:i], reverse=True):
+        # iterate in reversed order over candidate antecedents (system
+        # mentions are sorted, so there is no need to sort them again)
+        for ante in reversed(doc.system_mentions[:i]):
             for_anaphor_arcs.append((ana, ante))
 
         substructures.append(for_anaphor_arcs)
@@ -86,6 +87,77 @@ def extract_substructures(doc):
     return substructures
 
 
+def extract_pruned_training_substructures(doc):
+    """ Extract a pruned search space for the mention ranking model from
+    training data.
+
+    Like ``extract_substructures``, but for the ith mention only the
+    ``max(50, i/4)`` closest candidate antecedents and the dummy mention are
+    considered. To ensure that there is an antecedent decision consistent with
+    the gold annotation, the closest such antecedent is kept even if it is
+    pruned otherwise.
+
+    Args:
+        doc (CoNLLDocument): The document to extract substructures from.
+
+    Returns:
+        (list(list((Mention, Mention)))): The nested list of mention pairs
+        describing the search space for the substructures.
+    """
+    return __extract_pruned_substructures(doc, keep_consistent=True)
+
+
+def extract_pruned_testing_substructures(doc):
+    """ Extract a pruned search space for the mention ranking model from
+    testing data.
+
+    Like ``extract_substructures``, but for the ith mention only the
+    ``max(50, i/4)`` closest candidate antecedents and the dummy mention are
+    considered.
+
+    Args:
+        doc (CoNLLDocument): The document to extract substructures from.
+
+    Returns:
+        (list(list((Mention, Mention)))): The nested list of mention pairs
+        describing the search space for the substructures.
+    """
+    return __extract_pruned_substructures(doc, keep_consistent=False)
+
+
+def __extract_pruned_substructures(doc, keep_consistent):
+    substructures = []
+
+    for i, ana in enumerate(doc.system_mentions):
+        # ordered by distance, the dummy mention comes last
+        antecedents = doc.system_mentions[:i][::-1]
+
+        max_candidates = max(50, i // 4)
+
+        if len(antecedents) > max_candidates + 1:
+            candidates = antecedents[:max_candidates]
+
+            # the dummy mention (which is always kept) is consistent for
+            # anaphors which start a gold entity or are not annotated, only
+            # other anaphors may need an additional antecedent
+            if (keep_consistent
+                    and not ana.decision_is_consistent(antecedents[-1])
+                    and not any(ana.decision_is_consistent(ante)
+                                for ante in candidates)):
+                for ante in antecedents[max_candidates:-1]:
+                    if ana.decision_is_consistent(ante):
+                        candidates.append(ante)
+                        break
+
+            candidates.append(antecedents[-1])
+        else:
+            candidates = antecedents
+
+        substructures.append([(ana, ante) for ante in candidates])
+
+    return substructures
+
+
 class RankingPerceptron(perceptrons.Perceptron):
     """ A perceptron for mention ranking with latent antecedents. """
     def argmax(self, substructure, arc_information):
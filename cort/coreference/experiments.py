@@ -7,7 +7,7 @@ import logging
 __author__ = 'smartschat'
 
 
-def learn(training_corpus, instance_extractor, perceptron):
+def learn(training_corpus, instance_extractor, perceptron, cache_file=None):
     """ Learn a model for coreference resolution from training data.
 
     In particular, apply an instance/feature extractor to a training corpus and
@@ -21,6 +21,9 @@ def learn(training_corpus, instance_extractor, perceptron):
             extracted during training.
         perceptron (Perceptron): A perceptron (including a decoder) that
             learns from the instances extracted by ``instance_extractor``.
+        cache_file (str): A file for caching the extracted instances and
+            features across runs (see ``InstanceExtractor.extract``).
+            Defaults to None (no caching).
 
     Returns:
         A tuple consisting of
@@ -36,7 +39,7 @@ def learn(training_corpus, instance_extractor, perceptron):
 
     logging.info("\tExtracting instances and features.")
     substructures, arc_information = instance_extractor.extract(
-        training_corpus)
+        training_corpus, cache_file)
 
     logging.info("\tFitting model parameters.")
 
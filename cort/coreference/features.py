@@ -9,13 +9,19 @@ either a string, a bool, or a scalar.
 from __future__ import division
 
 
-import re
+from cort.core import util
 
 
-from cort.core import spans
+__author__ = 'smartschat'
 
 
-__author__ = 'smartschat'
+# tokens and part-of-speech tags which are not considered modifiers
+__non_modifier_tokens = {"the", "this", "that", "those", "these", "a", "an"}
+__non_modifier_pos = {"POS", "IN"}
+
+# modifiers of mentions, by tokens, part-of-speech tags and in-mention head
+# position
+__modifier_cache = {}
 
 
 def fine_type(mention):
@@ -454,22 +460,32 @@ def __compute_token_distance(anaphor, antecedent):
 
 
 def __get_modifier(mention):
-    head_span_in_mention = spans.Span(
-        mention.attributes["head_span"].begin - mention.span.begin,
-        mention.attributes["head_span"].end - mention.span.begin)
+    head_span = mention.attributes["head_span"]
+
+    # the modifiers only depend on tokens, part-of-speech tags and the
+    # position of the head, and a mention is part of many pairs, so results
+    # are cached by these values (mentions themselves are not modified)
+    key = (tuple(mention.attributes["tokens"]),
+           tuple(mention.attributes["pos"]),
+           head_span.begin - mention.span.begin,
+           head_span.end - mention.span.begin)
+
+    if key not in __modifier_cache:
+        __modifier_cache[key] = __compute_modifier(*key)
+
+    return __modifier_cache[key]
+
 
+def __compute_modifier(tokens, pos_tags, head_begin, head_end):
     modifiers = set()
 
-    for index, (token, pos) in enumerate(
-            zip(mention.attributes["tokens"], mention.attributes["pos"])):
-        if (token.lower() not in ["the", "this", "that", "those", "these",
-                                  "a", "an"]
-            and pos not in ["POS", "IN"]
-            and (index < head_span_in_mention.begin
-                 or index > head_span_in_mention.end)):
+    for index, (token, pos) in enumerate(zip(tokens, pos_tags)):
+        if (token.lower() not in __non_modifier_tokens
+            and pos not in __non_modifier_pos
+            and (index < head_begin or index > head_end)):
             modifiers.add(token.lower())
 
-    return modifiers
+    return frozenset(modifiers)
 
 
 def __are_alias(anaphor, antecedent):
@@ -506,9 +522,9 @@ def __are_alias(anaphor, antecedent):
 def __get_category_for_alias(anaphor_ner, antecedent_ner):
     if anaphor_ner == "PERSON" and antecedent_ner == "PERSON":
         return "PERSON"
-    elif re.match(r"LOC", anaphor_ner) and re.match(r"LOC", antecedent_ner):
+    elif anaphor_ner.startswith("LOC") and antecedent_ner.startswith("LOC"):
         return "LOC"
-    elif re.match(r"ORG", anaphor_ner) and re.match(r"(ORG)", antecedent_ner):
+    elif anaphor_ner.startswith("ORG") and antecedent_ner.startswith("ORG"):
         return "ORG"
 
 
@@ -564,10 +580,9 @@ def __is_abbreviation(anaphor_cleaned_tokens, antecedent_cleaned_tokens):
 
 
 def __get_acronyms(cleaned_tokens):
-    company_designator = r'assoc|bros|co|coop|corp|devel|inc|llc|ltd\.?'
     tokens_without_designator = [token for token in cleaned_tokens if
-                                 not re.match(company_designator,
-                                              token.lower())]
+                                 not util.company_designator.match(
+                                     token.lower())]
 
     return " ".join(tokens_without_designator), \
            "".join([token[0] for token in tokens_without_designator if
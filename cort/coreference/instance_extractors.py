@@ -1,12 +1,18 @@
 """ Extract instances and features from a corpus. """
 
 import array
+import gzip
+import logging
 import multiprocessing
+import os
+import pickle
 import sys
 
 import mmh3
 import numpy
 
+from cort.util import file_helper
+
 
 __author__ = 'martscsn'
 
@@ -16,6 +22,28 @@ def unwrap_extract_doc(arg, **kwarg):
     return InstanceExtractor._extract_doc(*arg, **kwarg)
 
 
+# version of the format of cached extraction results, must be increased
+# whenever mention extraction, feature computation or the layout of the
+# results changes, since cached results refer to mentions by their position
+# in the system mentions of a document
+CACHE_FORMAT_VERSION = 2
+
+
+# names of the types of feature values which are treated as numeric
+_numeric_types = frozenset(["float", "int"])
+
+
+# mmh3 hashes str as its UTF-8 encoding, so only python 2 unicode strings
+# have to be encoded explicitly (feature hashes must stay the same, since
+# trained models refer to them)
+if sys.version_info[0] == 2:
+    def _hash_feature(word):
+        return mmh3.hash(word.encode("utf-8")) & 2 ** 24 - 1
+else:
+    def _hash_feature(word):
+        return mmh3.hash(word) & 2 ** 24 - 1
+
+
 class InstanceExtractor:
     """ Extract instances and their corresponding features from a corpus.
 
@@ -74,11 +102,22 @@ class InstanceExtractor:
         else:
             self.convert_to_string_function = str
 
-    def extract(self, corpus):
+    def extract(self, corpus, cache_file=None):
         """ Extract instances and features from a corpus.
 
         Args:
             corpus (Corpus): The corpus to extract instances and features from.
+            cache_file (str): If provided, the raw per-document extraction
+                results are loaded from this file if it exists, and are
+                written to it otherwise. Callers are responsible for choosing
+                a file name which identifies corpus, features, extraction
+                settings and the code version (see ``CACHE_FORMAT_VERSION``).
+                Cached results refer to system mentions by position, so they
+                must not be reused after mention extraction or features
+                change. As a safeguard, the number of system mentions of
+                each document is stored with the results, and the results
+                are extracted again if it does not match the corpus.
+                Defaults to None (no caching).
 
         Returns:
             A tuple which describes the extracted instances and their
@@ -106,17 +145,16 @@ class InstanceExtractor:
         for doc in corpus:
             id_to_doc_mapping[doc.identifier] = doc
 
-        pool = multiprocessing.Pool(maxtasksperchild=1)
+        results = None
 
-        if sys.version_info[0] == 2:
-            results = pool.map(unwrap_extract_doc,
-                               zip([self] * len(corpus.documents),
-                                   corpus.documents))
-        else:
-            results = pool.map(self._extract_doc, corpus.documents)
+        if cache_file is not None:
+            results = InstanceExtractor._load_cache(cache_file, corpus)
 
-        pool.close()
-        pool.join()
+        if results is None:
+            results = self._extract_docs(corpus)
+
+            if cache_file is not None:
+                InstanceExtractor._write_cache(cache_file, corpus, results)
 
         num_labels = len(self.labels)
 
@@ -186,6 +224,97 @@ class InstanceExtractor:
 
         return all_substructures, arc_information
 
+    @staticmethod
+    def _get_mention_counts(corpus):
+        return dict((doc.identifier, len(doc.system_mentions))
+                    for doc in corpus)
+
+    @staticmethod
+    def _load_cache(cache_file, corpus):
+        if not os.path.exists(cache_file):
+            return None
+
+        with gzip.open(cache_file, "rb") as f:
+            mention_counts, results = pickle.load(f)
+
+        # cached results refer to mentions by position, so they only fit
+        # documents with the same number of system mentions
+        if mention_counts != InstanceExtractor._get_mention_counts(corpus):
+            logging.warning("\tSystem mentions do not match the instance "
+                            "cache " + cache_file + ", extracting again.")
+            return None
+
+        logging.info("\tLoaded instances and features from cache " +
+                     cache_file + ".")
+
+        return results
+
+    @staticmethod
+    def _write_cache(cache_file, corpus, results):
+        # write to a temporary file first, such that an interrupted run does
+        # not leave a corrupt cache behind
+        temporary_file = cache_file + ".tmp"
+
+        with gzip.open(temporary_file, "wb") as f:
+            pickle.dump((InstanceExtractor._get_mention_counts(corpus),
+                         results),
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        file_helper.replace(temporary_file, cache_file)
+
+    def apply_cost_function(self, arc_information, cost_function):
+        """ Recompute the costs of extracted arcs for another cost function.
+
+        Feature extraction does not depend on the cost function. Hence, when
+        several cost functions should be evaluated on the same data, instances
+        and features can be extracted once via ``self.extract``, and the costs
+        can then be recomputed with this function.
+
+        Args:
+            arc_information (dict((Mention, Mention),
+                                  ((array, array, array), list(int), bool)):
+                A mapping of arcs to information about these arcs, as
+                obtained from ``self.extract``.
+            cost_function (function: (Mention, Mention) -> int): A function
+                assigning costs to mention pairs.
+
+        Returns:
+            dict((Mention, Mention), ((array, array, array), list(int), bool)):
+            A copy of ``arc_information`` where the costs are computed
+            according to ``cost_function``.
+        """
+        arc_information_with_costs = {}
+
+        for arc, (feats, _, cons) in arc_information.items():
+            costs = self._compute_costs(arc, cost_function)
+
+            # in python 2, array.array does not support the buffer interface
+            if sys.version_info[0] == 2:
+                costs = numpy.array(costs, dtype=float)
+
+            arc_information_with_costs[arc] = (feats, costs, cons)
+
+        return arc_information_with_costs
+
+    def _compute_costs(self, arc, cost_function):
+        return array.array('H', [cost_function(arc, label) for label
+                                 in self.labels])
+
+    def _extract_docs(self, corpus):
+        pool = multiprocessing.Pool(maxtasksperchild=1)
+
+        if sys.version_info[0] == 2:
+            results = pool.map(unwrap_extract_doc,
+                               zip([self] * len(corpus.documents),
+                                   corpus.documents))
+        else:
+            results = pool.map(self._extract_doc, corpus.documents)
+
+        pool.close()
+        pool.join()
+
+        return results
+
     def _extract_doc(self, doc):
         cache = {}
         substructures = self.extract_substructures(doc)
@@ -221,8 +350,7 @@ class InstanceExtractor:
                 antecedents.append(mentions_to_ids[arc[1]])
 
                 # cost for each label
-                for label in self.labels:
-                    costs.append(self.cost_function(arc, label))
+                costs.extend(self._compute_costs(arc, self.cost_function))
 
                 # is decision to make them coreferent consistent with gold?
                 consistency.append(arc[0].decision_is_consistent(arc[1]))
@@ -264,47 +392,48 @@ class InstanceExtractor:
         anaphor, antecedent = arc
         inst_feats = []
         numeric_features = []
+        nonnumeric_hashes = []
 
-        numeric_types = {"float", "int"}
+        numeric_types = _numeric_types
 
         if not antecedent.is_dummy():
-            # mention features
+            # mention features, converted to strings and hashed once per
+            # mention
             for mention in [anaphor, antecedent]:
                 if mention not in cache:
-                    cache[mention] = [feature(mention) for feature
-                                      in self.mention_features]
+                    cache[mention] = self._get_mention_feature_strings(
+                        mention, numeric_types)
 
-            ana_features = cache[anaphor]
-            ante_features = cache[antecedent]
+            (ana_nonnumeric, ana_hashes, ana_all,
+             ana_numeric) = cache[anaphor]["ana_"]
+            (ante_nonnumeric, ante_hashes, ante_all,
+             ante_numeric) = cache[antecedent]["ante_"]
 
             # first: non-numeric features (categorial, boolean)
-            inst_feats += ["ana_" + feat + "=" +
-                           self.convert_to_string_function(val) for feat, val in
-                           ana_features if type(val).__name__ not in
-                           numeric_types]
+            inst_feats += ana_nonnumeric
 
             len_ana_features = len(inst_feats)
 
-            inst_feats += ["ante_" + feat + "=" +
-                           self.convert_to_string_function(val) for feat, val in
-                           ante_features if type(val).__name__ not in
-                           numeric_types]
+            inst_feats += ante_nonnumeric
+
+            nonnumeric_hashes = ana_hashes + ante_hashes
 
             # concatenated features
-            inst_feats += ["ana_" + ana_info[0] + "=" +
-                           self.convert_to_string_function(ana_info[1]) +
-                           "^ante_" + ante_info[0] + "=" +
-                           self.convert_to_string_function(ante_info[1])
-                           for ana_info, ante_info in
-                           zip(ana_features, ante_features)]
-
-            # pairwise features
-            pairwise_features = [feature(anaphor, antecedent) for feature
-                                 in self.pairwise_features]
-            inst_feats += [feature + "=" +
-                           self.convert_to_string_function(val) for feature, val
-                           in pairwise_features
-                           if val and type(val).__name__ not in numeric_types]
+            inst_feats += [ana_info + "^" + ante_info for ana_info, ante_info
+                           in zip(ana_all, ante_all)]
+
+            # pairwise features, split into numeric and non-numeric features
+            # in one pass
+            pair_numeric = []
+
+            for feature in self.pairwise_features:
+                name, val = feature(anaphor, antecedent)
+
+                if type(val).__name__ in numeric_types:
+                    pair_numeric.append((name, val))
+                elif val:
+                    inst_feats.append(
+                        name + "=" + self.convert_to_string_function(val))
 
             # feature combinations
             fine_type_indices = {len_ana_features * i for i
@@ -317,14 +446,8 @@ class InstanceExtractor:
             ]
 
             # now numeric features
-            ana_numeric = [("ana_" + feat, val) for feat, val
-                           in ana_features
-                           if type(val).__name__ in numeric_types]
-            ante_numeric = [("ante_" + feat, val) for feat, val
-                            in ante_features
-                            if type(val).__name__ in numeric_types]
-            pair_numeric = [(feat, val) for feat, val in pairwise_features
-                            if type(val).__name__ in numeric_types]
+            ana_numeric = list(ana_numeric)
+            ante_numeric = list(ante_numeric)
 
             # feature combinations for numeric features
             for numeric_features in [ana_numeric, ante_numeric, pair_numeric]:
@@ -336,13 +459,42 @@ class InstanceExtractor:
 
             numeric_features = ana_numeric + ante_numeric + pair_numeric
 
-        # to hash
+        # to hash, mention features are already hashed
         all_nonnumeric_feats = array.array(
-            'I', [mmh3.hash(word.encode("utf-8")) & 2 ** 24 - 1 for word
-                  in inst_feats])
+            'I', nonnumeric_hashes + [
+                _hash_feature(word) for word
+                in inst_feats[len(nonnumeric_hashes):]])
         all_numeric_feats = array.array(
-            'I', [mmh3.hash(word.encode("utf-8")) & 2 ** 24 - 1 for word, _
+            'I', [_hash_feature(word) for word, _
                   in numeric_features])
         numeric_vals = array.array("f", [val for _, val in numeric_features])
 
         return all_nonnumeric_feats, all_numeric_feats, numeric_vals
+
+    def _get_mention_feature_strings(self, mention, numeric_types):
+        feature_strings = {}
+
+        features = [feature(mention) for feature in self.mention_features]
+
+        # the mention may appear both as anaphor and as antecedent
+        for prefix in ["ana_", "ante_"]:
+            nonnumeric = []
+            all_features = []
+            numeric = []
+
+            for feat, val in features:
+                all_features.append(
+                    prefix + feat + "=" + self.convert_to_string_function(val))
+
+                if type(val).__name__ in numeric_types:
+                    numeric.append((prefix + feat, val))
+                else:
+                    nonnumeric.append(all_features[-1])
+
+            feature_strings[prefix] = (
+                nonnumeric,
+                [_hash_feature(word) for word in nonnumeric],
+                all_features,
+                numeric)
+
+        return feature_strings
@@ -39,5 +39,7 @@ class MultigraphDecoder:
                     (multigraph.get_weight(mention, antecedent), antecedent))
 
         # get antecedent with highest positive weight, break ties by distance
-        if len(weights) > 0 and sorted(weights)[-1][0] > 0:
-            return sorted(weights)[-1][1]
+        if weights:
+            best_weight, best_antecedent = max(weights)
+            if best_weight > 0:
+                return best_antecedent
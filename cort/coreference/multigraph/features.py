@@ -1,5 +1,3 @@
-import re
-
 from cort.core import external_data
 from cort.core import spans
 from cort.core import util
@@ -306,9 +304,9 @@ def alias(anaphor, antecedent):
 def get_category_for_alias(anaphor_ner, antecedent_ner):
     if anaphor_ner == "PERSON" and antecedent_ner == "PERSON":
         return "PERSON"
-    elif re.match(r"LOC", anaphor_ner) and re.match(r"LOC", antecedent_ner):
+    elif anaphor_ner.startswith("LOC") and antecedent_ner.startswith("LOC"):
         return "LOC"
-    elif re.match(r"ORG", anaphor_ner) and re.match(r"(ORG)", antecedent_ner):
+    elif anaphor_ner.startswith("ORG") and antecedent_ner.startswith("ORG"):
         return "ORG"
 
 
@@ -367,10 +365,9 @@ def is_abbreviation(anaphor_cleaned_tokens, antecedent_cleaned_tokens):
 
 
 def get_acronyms(cleaned_tokens):
-    company_designator = r'assoc|bros|co|coop|corp|devel|inc|llc|ltd\.?'
-    tokens_without_designator = [token for token in cleaned_tokens
-                                 if not re.match(company_designator,
-                                                 token.lower())]
+    tokens_without_designator = [
+        token for token in cleaned_tokens
+        if not util.company_designator.match(token.lower())]
 
     return (" ".join(tokens_without_designator),
             "".join([token[0] for token in tokens_without_designator
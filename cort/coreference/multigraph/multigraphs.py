@@ -18,9 +18,7 @@ class CorefMultigraphCreator:
         nodes = []
         edges = {}
 
-        for i in range(0, len(mentions)):
-            anaphor = mentions[i]
-
+        for i, anaphor in enumerate(mentions):
             nodes.append(anaphor)
 
             edges[anaphor] = self.construct_for_one_mention(mentions, i)
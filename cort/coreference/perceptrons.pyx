@@ -411,18 +411,24 @@ cdef class Perceptron:
 
         best_is_consistent = False
 
+        # look up everything that only depends on the label once, instead of
+        # once per arc
+        cdef double prior = self.priors[label]
+        cdef double[:] weights = self.weights[label]
+        cdef int label_index = self.label_to_index[label]
+
         for arc in arcs:
             features, costs, consistent = arc_information[arc]
 
             nonnumeric_features, numeric_features, numeric_vals = features
 
-            score = self._cython_score_arc(self.priors[label],
-                                      self.weights[label],
-                                      self.cost_scaling,
-                                      costs[self.label_to_index[label]],
-                                      nonnumeric_features,
-                                      numeric_features,
-                                      numeric_vals)
+            score = self._cython_score_arc(prior,
+                                           weights,
+                                           self.cost_scaling,
+                                           costs[label_index],
+                                           nonnumeric_features,
+                                           numeric_features,
+                                           numeric_vals)
 
             if score > max_val:
                 best = arc
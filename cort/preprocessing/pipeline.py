@@ -2,7 +2,7 @@ __author__ = 'martscsn'
 
 import cort
 
-import codecs
+import io
 
 import stanford_corenlp_pywrapper
 
@@ -34,9 +34,8 @@ class Pipeline():
         processed_documents = []
 
         for doc in docs:
-            processed_documents.append(self.run_on_doc(
-                codecs.open(doc, "r", "utf-8")
-            ))
+            with io.open(doc, "r", encoding="utf-8") as doc_file:
+                processed_documents.append(self.run_on_doc(doc_file))
 
         return corpora.Corpus(identifier, processed_documents)
 
@@ -65,12 +64,12 @@ class Pipeline():
                 label, head, in_sent_index = dep_info
                 index_to_dep_info[in_sent_index] = label, head
 
-            for i in range(0, len(sentence["tokens"])):
-                if i in index_to_dep_info.keys():
+            for i, token in enumerate(sentence["tokens"]):
+                if i in index_to_dep_info:
                     label, head = index_to_dep_info[i]
                     processed_dep.append(
                         CoNLL.Token(
-                            form=sentence["tokens"][i],
+                            form=token,
                             lemma=sentence["lemmas"][i],
                             pos=sentence["pos"][i],
                             index=i+1,
@@ -86,7 +85,7 @@ class Pipeline():
                 else:
                     processed_dep.append(
                         CoNLL.Token(
-                            form=sentence["tokens"][i],
+                            form=token,
                             lemma=sentence["lemmas"][i],
                             pos=sentence["pos"][i],
                             index=i+1,
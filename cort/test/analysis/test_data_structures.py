@@ -95,5 +95,17 @@ test2	0	6	.   NN   *)	-   -   -   -   -   -
                                  system_output, "set_id")))
 
 
+class TestEnhancedSet(unittest.TestCase):
+    def test_enhanced_set(self):
+        first = data_structures.EnhancedSet([(1, 2), (3, 4), (1, 2)])
+        second = data_structures.EnhancedSet([(3, 4), (1, 2)])
+
+        self.assertEqual(2, len(first))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(data_structures.EnhancedSet([(3, 4)]),
+                         first.filter(lambda x: x[0] == 3))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -12,8 +12,9 @@ __author__ = 'smartschat'
 
 
 class TestErrorExtractor(unittest.TestCase):
-    def setUp(self):
-        self.first_cluster = [
+    @classmethod
+    def setUpClass(cls):
+        cls.first_cluster = [
             mentions.Mention(
                 None,
                 spans.Span(0, 0),
@@ -45,7 +46,7 @@ class TestErrorExtractor(unittest.TestCase):
                 {"tokens": ["h"], "annotated_set_id": 0}),
         ]
 
-        self.second_cluster = [
+        cls.second_cluster = [
             mentions.Mention(
                 None,
                 spans.Span(3, 4),
@@ -62,7 +63,7 @@ class TestErrorExtractor(unittest.TestCase):
                 {"tokens": ["k"], "annotated_set_id": 1})
         ]
 
-        self.system_cluster = [
+        cls.system_cluster = [
             mentions.Mention(
                 None,
                 spans.Span(0, 0),
@@ -94,7 +95,7 @@ class TestErrorExtractor(unittest.TestCase):
                 {"tokens": ["k"], "annotated_set_id": 1})
         ]
 
-        self.maxDiff = None
+        cls.maxDiff = None
 
     def test_compute_errors(self):
         # fake document using a named tuple
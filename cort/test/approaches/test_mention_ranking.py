@@ -0,0 +1,91 @@
+import unittest
+
+# compiles the perceptrons, which are imported by the approaches
+from cort.util import import_helper
+from cort.coreference.approaches import mention_ranking
+from cort.core.mentions import Mention
+from cort.core.spans import Span
+
+
+__author__ = 'smartschat'
+
+
+class Document:
+    def __init__(self, system_mentions):
+        self.system_mentions = system_mentions
+
+
+class TestMentionRanking(unittest.TestCase):
+    def setUp(self):
+        # mentions 2, 5 and 60 are coreferent, all other mentions are not
+        # annotated
+        set_ids = {2: 0, 5: 0, 60: 0}
+
+        self.mentions = [Mention.dummy_from_document(None)] + [
+            Mention(None, Span(i, i), {
+                "annotated_set_id": set_ids.get(i),
+                "first_in_gold_entity": i == 2
+            })
+            for i in range(1, 221)
+        ]
+
+        self.document = Document(self.mentions)
+
+    def get_antecedents(self, substructure):
+        return [ante for _, ante in substructure]
+
+    def test_extract_pruned_testing_substructures(self):
+        substructures = mention_ranking.extract_pruned_testing_substructures(
+            self.document)
+
+        self.assertEqual(len(self.mentions), len(substructures))
+        self.assertEqual([], substructures[0])
+
+        for i, substructure in enumerate(substructures[1:], 1):
+            for ana, _ in substructure:
+                self.assertEqual(self.mentions[i], ana)
+
+            # the dummy mention is always a candidate
+            self.assertTrue(substructure[-1][1].is_dummy())
+
+        # no pruning if there are at most 50 candidates besides the dummy
+        self.assertEqual(self.mentions[:51][::-1],
+                         self.get_antecedents(substructures[51]))
+
+        self.assertEqual(self.mentions[2:52][::-1] + [self.mentions[0]],
+                         self.get_antecedents(substructures[52]))
+
+        # for the ith mention, the max(50, i/4) closest candidates are kept
+        self.assertEqual(self.mentions[150:200][::-1] + [self.mentions[0]],
+                         self.get_antecedents(substructures[200]))
+
+        self.assertEqual(self.mentions[165:220][::-1] + [self.mentions[0]],
+                         self.get_antecedents(substructures[220]))
+
+        # the coreferent mentions are pruned
+        self.assertEqual(self.mentions[10:60][::-1] + [self.mentions[0]],
+                         self.get_antecedents(substructures[60]))
+
+    def test_extract_pruned_training_substructures(self):
+        substructures = mention_ranking.extract_pruned_training_substructures(
+            self.document)
+
+        testing_substructures = \
+            mention_ranking.extract_pruned_testing_substructures(
+                self.document)
+
+        # the closest consistent antecedent is kept, even if it is outside
+        # the window
+        self.assertEqual(
+            self.mentions[10:60][::-1] + [self.mentions[5], self.mentions[0]],
+            self.get_antecedents(substructures[60]))
+
+        # for all other mentions the dummy mention is consistent, so the
+        # search space is the same as for testing
+        for i, substructure in enumerate(substructures):
+            if i != 60:
+                self.assertEqual(testing_substructures[i], substructure)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,8 +10,11 @@ __author__ = 'smartschat'
 
 
 class TestDocuments(unittest.TestCase):
-    def setUp(self):
-        self.real_example = """#begin document (bn/voa/02/voa_0220); part 000
+    @classmethod
+    def setUpClass(cls):
+        # documents are parsed once for all tests, tests which modify a
+        # document undo their changes
+        cls.real_example = """#begin document (bn/voa/02/voa_0220); part 000
 bn/voa/02/voa_0220   0    0    Unidentified    JJ  (TOP(S(NP(NP*          -   -   -   -            *    -
 bn/voa/02/voa_0220   0    1          gunmen   NNS              *)         -   -   -   -            *    -
 bn/voa/02/voa_0220   0    2              in    IN           (PP*          -   -   -   -            *    -
@@ -52,7 +55,7 @@ bn/voa/02/voa_0220   0   13              .     .            *))         -    -
 
 #end document
 """
-        self.complicated_mention_example = """#begin document (/test2); part 000
+        cls.complicated_mention_example = """#begin document (/test2); part 000
 test2	0	0	This    NN   (NP*	-   -   -   -   -   (0)
 test2	0	1	is  NN	*   -   -   -   -   -   -
 test2	0	2	just    NN   *	-   -   -   -   -   -
@@ -71,7 +74,7 @@ test2	0	6	.   NN   *)	-   -   -   -   -   -
 #end document
 """
 
-        self.another_real_example = """#begin document (mz/sinorama/10/ectb_1050); part 006
+        cls.another_real_example = """#begin document (mz/sinorama/10/ectb_1050); part 006
 mz/sinorama/10/ectb_1050        6       0       What    WP      (TOP(SBARQ(WHNP*)       -       -       -       -       *       (R-ARG1*)       -
 mz/sinorama/10/ectb_1050        6       1       does    VBZ     (SQ*    do      -       7       -       *       *       -
 mz/sinorama/10/ectb_1050        6       2       this    DT      (NP*)   -       -       -       -       *       (ARG0*) -
@@ -89,7 +92,7 @@ mz/sinorama/10/ectb_1050        6       12      ?       .       *))     -
 #end	document
 """
 
-        self.yemen_example = """#begin document (bn/abc/00/abc_0030); part 000
+        cls.yemen_example = """#begin document (bn/abc/00/abc_0030); part 000
 bn/abc/00/abc_0030      0       0       Intelligence    NN      (TOP(S(NP*      -       -       -       -       *       (ARG0*  *       -
 bn/abc/00/abc_0030      0       1       sources NNS     *)      source  -       3       -       *       *)      *       -
 bn/abc/00/abc_0030      0       2       say     VBP     (VP*    say     01      1       -       *       (V*)    *       -
@@ -123,12 +126,13 @@ bn/abc/00/abc_0030      0       28      .       .       *))     -       -
 #end document
 """
 
-        self.real_document = CoNLLDocument(self.real_example)
-        self.complicated_mention_document = CoNLLDocument(
-            self.complicated_mention_example)
-        self.another_real_document = CoNLLDocument(self.another_real_example)
-        self.yemen_document = CoNLLDocument(self.yemen_example)
+        cls.real_document = CoNLLDocument(cls.real_example)
+        cls.complicated_mention_document = CoNLLDocument(
+            cls.complicated_mention_example)
+        cls.another_real_document = CoNLLDocument(cls.another_real_example)
+        cls.yemen_document = CoNLLDocument(cls.yemen_example)
 
+    def setUp(self):
         self.maxDiff = None
 
     def test_get_identifier(self):
@@ -183,6 +187,11 @@ bn/abc/00/abc_0030      0       28      .       .       *))     -       -
         expected = 1, Span(22, 35)
         self.assertEqual(expected, self.real_document.get_sentence_id_and_span(
             Span(23, 24)))
+        self.assertEqual((0, Span(0, 21)),
+                         self.real_document.get_sentence_id_and_span(
+                             Span(0, 0)))
+        self.assertEqual(None, self.real_document.get_sentence_id_and_span(
+            Span(20, 23)))
 
     def test_parse(self):
         expected = nltk.ParentedTree.fromstring(
@@ -212,6 +221,9 @@ test2	0	6	.	NN	*)	-	-	-	-	-	-
 #end document
 """
 
+        self.addCleanup(setattr, self.complicated_mention_document,
+                        "system_mentions", [])
+
         self.complicated_mention_document.system_mentions = [
             Mention(self.complicated_mention_document, Span(0, 0),
                     {"set_id": 1}),
@@ -10,8 +10,10 @@ __author__ = 'smartschat'
 
 
 class TestHeadFinder(unittest.TestCase):
-    def setUp(self):
-        self.head_finder = head_finders.HeadFinder()
+    @classmethod
+    def setUpClass(cls):
+        # head finders are stateless apart from caches, so one is shared
+        cls.head_finder = head_finders.HeadFinder()
 
     def test_get_head_np(self):
         self.assertEqual(nltk.ParentedTree("NNS", ["police"]), self.head_finder.get_head(nltk.ParentedTree.fromstring("(NP (JJ Local) (NNS police))")))
@@ -20,6 +22,7 @@ class TestHeadFinder(unittest.TestCase):
         self.assertEqual(nltk.ParentedTree("NN", ["wedding"]), self.head_finder.get_head(nltk.ParentedTree.fromstring("(NP (NP (NP (PRP$ his) (NN brother) (POS 's)) (NN wedding)) (PP (IN in) (NP (NNP Khan) (NNPS Younes))))")))
         self.assertEqual(nltk.ParentedTree("NNP", ["Taiwan"]), self.head_finder.get_head(nltk.ParentedTree.fromstring("(NP (NNP Taiwan) (POS 's))")))
         self.assertEqual(nltk.ParentedTree("NN", ["port"]), self.head_finder.get_head(nltk.ParentedTree.fromstring("(NP (NP (NP (NNP Yemen) (POS 's)) (NN port)) (PP (IN of) (NP (NNP Aden))))")))
+        self.assertEqual(nltk.ParentedTree("RB", ["fast"]), self.head_finder.get_head(nltk.ParentedTree.fromstring("(NP (DT the) (VP (VBG running) (ADVP (RB fast))))")))
 
     def test_get_head_vp(self):
         self.assertEqual(nltk.ParentedTree("VB", ["shoot"]), self.head_finder.get_head(nltk.ParentedTree.fromstring("(VP (VB shoot))")))
@@ -12,8 +12,11 @@ __author__ = 'smartschat'
 
 
 class TestMentionExtractor(unittest.TestCase):
-    def setUp(self):
-        self.real_example = """#begin document (bn/voa/02/voa_0220); part 000
+    @classmethod
+    def setUpClass(cls):
+        # documents and trees are parsed once for all tests, tests which
+        # modify them undo their changes
+        cls.real_example = """#begin document (bn/voa/02/voa_0220); part 000
 bn/voa/02/voa_0220   0    0    Unidentified    JJ  (TOP(S(NP(NP*          -   -   -   -            *    -
 bn/voa/02/voa_0220   0    1          gunmen   NNS              *)         -   -   -   -            *    -
 bn/voa/02/voa_0220   0    2              in    IN           (PP*          -   -   -   -            *    -
@@ -55,7 +58,7 @@ bn/voa/02/voa_0220   0   13              .     .            *))         -    -
 #end document
 """
 
-        self.another_real_example = """#begin document (mz/sinorama/10/ectb_1050); part 006
+        cls.another_real_example = """#begin document (mz/sinorama/10/ectb_1050); part 006
 mz/sinorama/10/ectb_1050        6       0       What    WP      (TOP(SBARQ(WHNP*)       -       -       -       -       *       (R-ARG1*)       -
 mz/sinorama/10/ectb_1050        6       1       does    VBZ     (SQ*    do      -       7       -       *       *       -
 mz/sinorama/10/ectb_1050        6       2       this    DT      (NP*)   -       -       -       -       *       (ARG0*) -
@@ -72,29 +75,29 @@ mz/sinorama/10/ectb_1050        6       12      ?       .       *))     -
 
 #end	document"""
 
-        self.real_document = documents.CoNLLDocument(self.real_example)
-        self.another_real_document = documents.CoNLLDocument(
-            self.another_real_example)
+        cls.real_document = documents.CoNLLDocument(cls.real_example)
+        cls.another_real_document = documents.CoNLLDocument(
+            cls.another_real_example)
 
-        self.tree = nltk.ParentedTree.fromstring(
+        cls.tree = nltk.ParentedTree.fromstring(
             "(NP (NP (NP (PRP$ his) (NN brother) (POS 's)) (NN wedding)) "
             "(PP (IN in) (NP (NNP Khan) (NNPS Younes))))")
 
-        self.proper_name_mention_tree = nltk.ParentedTree.fromstring(
+        cls.proper_name_mention_tree = nltk.ParentedTree.fromstring(
             "(NP (NNP Taiwan) (POS 's))")
-        self.proper_name_mention_ner = ["GPE", "NONE"]
+        cls.proper_name_mention_ner = ["GPE", "NONE"]
 
-        self.apposition_tree = nltk.ParentedTree.fromstring(
+        cls.apposition_tree = nltk.ParentedTree.fromstring(
             "(NP (NP (NP (NNP Secretary)) (PP (IN of) (NP (NNP State)))) "
             "(NP (NNP Madeleine) (NNP Albright)))")
 
-        self.apposition_ner = ["NONE", "NONE", "NONE", "PERSON", "PERSON"]
+        cls.apposition_ner = ["NONE", "NONE", "NONE", "PERSON", "PERSON"]
 
-        self.more_proper_name_tree = nltk.ParentedTree.fromstring(
+        cls.more_proper_name_tree = nltk.ParentedTree.fromstring(
             "(NP (NP (DT the) (NNP General) (NNP Secretary)) (PP (IN of) "
             "(NP (DT the) (NNP CCP))))")
 
-        self.more_proper_name_ner = ["NONE", "NONE", "NONE", "NONE", "NONE",
+        cls.more_proper_name_ner = ["NONE", "NONE", "NONE", "NONE", "NONE",
                                      "ORG"]
 
     def test_extract_system_mentions(self):
@@ -413,5 +416,18 @@ mz/sinorama/10/ectb_1050        6       12      ?       .       *))     -
             mention_extractor.post_process_appositions(
                 two_children_all_mentions))
 
+    def test_post_process_weird(self):
+        # mentions do not need the tokens_as_lowercase_string attribute
+        all_mentions = [
+            mentions.Mention(None, spans.Span(0, 0), {"tokens": ["Hmm"]}),
+            mentions.Mention(None, spans.Span(1, 1), {"tokens": ["U.S."]}),
+            mentions.Mention(None, spans.Span(2, 3),
+                             {"tokens": ["the", "company"]})
+        ]
+
+        self.assertEqual(
+            [all_mentions[2]],
+            mention_extractor.post_process_weird(all_mentions))
+
 if __name__ == '__main__':
     unittest.main()
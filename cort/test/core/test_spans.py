@@ -12,6 +12,17 @@ class TestSpan(unittest.TestCase):
         self.assertEqual(0, span.begin)
         self.assertEqual(1, span.end)
 
+    def test_compare(self):
+        self.assertTrue(Span(0, 1) < Span(0, 2))
+        self.assertTrue(Span(0, 5) < Span(1, 1))
+        self.assertFalse(Span(1, 1) < Span(1, 1))
+        self.assertTrue(Span(1, 1) <= Span(1, 1))
+        self.assertTrue(Span(2, 0) > Span(1, 7))
+        self.assertEqual(Span(3, 4), Span(3, 4))
+        self.assertNotEqual(Span(3, 4), Span(3, 5))
+        self.assertNotEqual(Span(3, 4), None)
+        self.assertEqual(hash(Span(3, 4)), hash(Span(3, 4)))
+
     def test_parse(self):
         self.assertEqual(Span(10, 12), Span.parse("(10, 12)"))
         self.assertEqual(Span(10, 12), Span.parse("(10,12)"))
@@ -0,0 +1,143 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+# compiles the perceptrons, which are imported by the approaches
+from cort.util import import_helper
+from cort.core import corpora
+from cort.core import documents
+from cort.core import mention_extractor
+from cort.coreference import cost_functions
+from cort.coreference import features
+from cort.coreference import instance_extractors
+from cort.coreference.approaches import mention_ranking
+
+
+__author__ = 'smartschat'
+
+
+class TestInstanceExtractor(unittest.TestCase):
+    def setUp(self):
+        example = """#begin document (bn/voa/02/voa_0220); part 000
+bn/voa/02/voa_0220   0    0    Unidentified    JJ  (TOP(S(NP(NP*          -   -   -   -            *    -
+bn/voa/02/voa_0220   0    1          gunmen   NNS              *)         -   -   -   -            *    -
+bn/voa/02/voa_0220   0    2              in    IN           (PP*          -   -   -   -            *    -
+bn/voa/02/voa_0220   0    3           north    JJ      (NP(ADJP*          -   -   -   -            *    -
+bn/voa/02/voa_0220   0    4         western    JJ              *)         -   -   -   -            *    -
+bn/voa/02/voa_0220   0    5        Colombia   NNP            *)))         -   -   -   -         (GPE)   -
+bn/voa/02/voa_0220   0    6            have   VBP           (VP*        have  -   -   -            *    -
+bn/voa/02/voa_0220   0    7       massacred   VBN           (VP*    massacre  -   -   -            *    -
+bn/voa/02/voa_0220   0    8              at    IN   (NP(QP(ADVP*          -   -   -   -   (CARDINAL*    -
+bn/voa/02/voa_0220   0    9           least   JJS              *)         -   -   -   -            *    -
+bn/voa/02/voa_0220   0   10          twelve    CD              *)         -   -   -   -            *)   -
+bn/voa/02/voa_0220   0   11        peasants   NNS              *)         -   -   -   -            *    -
+bn/voa/02/voa_0220   0   12              in    IN           (PP*          -   -   -   -            *    -
+bn/voa/02/voa_0220   0   13             the    DT        (NP(NP*          -   -   -   -            *   (0
+bn/voa/02/voa_0220   0   14          second    JJ              *          -   -   -   -     (ORDINAL)   -
+bn/voa/02/voa_0220   0   15            such    JJ              *          -   -   -   -            *    -
+bn/voa/02/voa_0220   0   16        incident    NN              *)   incident  -   2   -            *    -
+bn/voa/02/voa_0220   0   17              in    IN           (PP*          -   -   -   -            *    -
+bn/voa/02/voa_0220   0   18              as    RB        (NP(QP*          -   -   -   -       (DATE*    -
+bn/voa/02/voa_0220   0   19            many    JJ              *)         -   -   -   -            *    -
+bn/voa/02/voa_0220   0   20            days   NNS         *))))))        day  -   4   -            *)   0)
+bn/voa/02/voa_0220   0   21               .     .             *))         -   -   -   -            *    -
+
+bn/voa/02/voa_0220   0    0          Local    JJ    (TOP(S(NP*          -    -   -   -   *   (ARG0*             *    -
+bn/voa/02/voa_0220   0    1         police   NNS             *)     police   -   -   -   *        *)            *    -
+bn/voa/02/voa_0220   0    2            say   VBP          (VP*         say  01   1   -   *      (V*)            *    -
+bn/voa/02/voa_0220   0    3             it   PRP   (SBAR(S(NP*)         -    -   -   -   *   (ARG1*        (ARG1*)   -
+bn/voa/02/voa_0220   0    4             's   VBZ          (VP*          be  01   1   -   *        *           (V*)   -
+bn/voa/02/voa_0220   0    5            not    RB             *          -    -   -   -   *        *    (ARGM-NEG*)   -
+bn/voa/02/voa_0220   0    6          clear    JJ        (ADJP*)         -    -   -   -   *        *        (ARG2*)   -
+bn/voa/02/voa_0220   0    7            who    WP   (SBAR(WHNP*)         -    -   -   -   *        *             *    -
+bn/voa/02/voa_0220   0    8            was   VBD        (S(VP*          be   -   1   -   *        *             *    -
+bn/voa/02/voa_0220   0    9    responsible    JJ        (ADJP*          -    -   -   -   *        *             *    -
+bn/voa/02/voa_0220   0   10            for    IN          (PP*          -    -   -   -   *        *             *    -
+bn/voa/02/voa_0220   0   11            the    DT          (NP*          -    -   -   -   *        *             *   (0
+bn/voa/02/voa_0220   0   12       massacre    NN    *))))))))))   massacre   -   -   -   *        *)            *    0)
+bn/voa/02/voa_0220   0   13              .     .            *))         -    -   -   -   *        *             *    -
+
+#end document
+"""
+
+        document = documents.CoNLLDocument(example)
+        document.system_mentions = mention_extractor.extract_system_mentions(
+            document)
+
+        self.corpus = corpora.Corpus("test", [document])
+
+        self.extractor = instance_extractors.InstanceExtractor(
+            mention_ranking.extract_substructures,
+            [features.fine_type, features.head],
+            [features.exact_match, features.sentence_distance],
+            cost_functions.cost_based_on_consistency
+        )
+
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def get_comparable(self, extracted):
+        substructures, arc_information = extracted
+
+        comparable_arc_information = {}
+
+        for arc, ((nonnumeric, numeric, vals), costs, consistency) in \
+                arc_information.items():
+            comparable_arc_information[arc] = (list(nonnumeric),
+                                               list(numeric),
+                                               list(vals),
+                                               list(costs),
+                                               consistency)
+
+        return substructures, comparable_arc_information
+
+    def test_extract_with_cache(self):
+        cache_file = os.path.join(self.cache_dir, "cache.pkl.gz")
+
+        expected = self.get_comparable(self.extractor.extract(self.corpus))
+
+        self.assertEqual(expected, self.get_comparable(
+            self.extractor.extract(self.corpus, cache_file)))
+        self.assertTrue(os.path.exists(cache_file))
+        self.assertFalse(os.path.exists(cache_file + ".tmp"))
+
+        # the second call loads the results from the cache
+        self.assertEqual(expected, self.get_comparable(
+            self.extractor.extract(self.corpus, cache_file)))
+
+    def test_extract_with_stale_cache(self):
+        cache_file = os.path.join(self.cache_dir, "cache.pkl.gz")
+
+        self.extractor.extract(self.corpus, cache_file)
+
+        # the cached results do not fit the changed mentions anymore, so they
+        # are extracted again
+        document = self.corpus.documents[0]
+        document.system_mentions = document.system_mentions[:-1]
+
+        self.assertEqual(
+            self.get_comparable(self.extractor.extract(self.corpus)),
+            self.get_comparable(self.extractor.extract(self.corpus,
+                                                       cache_file)))
+
+    def test_apply_cost_function(self):
+        extractor_without_costs = instance_extractors.InstanceExtractor(
+            mention_ranking.extract_substructures,
+            [features.fine_type, features.head],
+            [features.exact_match, features.sentence_distance],
+            cost_functions.null_cost
+        )
+
+        substructures, arc_information = extractor_without_costs.extract(
+            self.corpus)
+
+        arc_information = extractor_without_costs.apply_cost_function(
+            arc_information, cost_functions.cost_based_on_consistency)
+
+        self.assertEqual(
+            self.get_comparable(self.extractor.extract(self.corpus)),
+            self.get_comparable((substructures, arc_information)))
+
+if __name__ == '__main__':
+    unittest.main()
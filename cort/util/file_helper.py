@@ -0,0 +1,26 @@
+""" Helpers for writing files. """
+
+import os
+import sys
+
+
+__author__ = 'smartschat'
+
+
+def replace(source, destination):
+    """ Move a file to a destination, replacing the destination if it exists.
+
+    This is used to write files atomically: the content is written to a
+    temporary file first, which is then moved to the final location, such
+    that an interrupted run never leaves a truncated file behind.
+
+    Args:
+        source (str): The path of the file to move.
+        destination (str): The path the file is moved to.
+    """
+    # os.replace is not available in python 2, there os.rename replaces the
+    # destination atomically on POSIX systems
+    if sys.version_info[0] == 2:
+        os.rename(source, destination)
+    else:
+        os.replace(source, destination)
@@ -1,4 +1,4 @@
-import codecs
+import io
 
 
 from cort.analysis import error_extractors
@@ -11,10 +11,12 @@ __author__ = 'smartschat'
 
 
 # read in corpora
-reference = corpora.Corpus.from_file("reference", codecs.open("dev.gold", "r",
-                                                              "utf-8"))
-pair = corpora.Corpus.from_file("pair", codecs.open("pair-dev.out", "r", "utf-8"))
-tree = corpora.Corpus.from_file("tree", codecs.open("tree-dev.out", "r", "utf-8"))
+reference = corpora.Corpus.from_file("reference", io.open("dev.gold", "r",
+                                                           encoding="utf-8"))
+pair = corpora.Corpus.from_file("pair", io.open("pair-dev.out", "r",
+                                                 encoding="utf-8"))
+tree = corpora.Corpus.from_file("tree", io.open("tree-dev.out", "r",
+                                                 encoding="utf-8"))
 
 # optional -- not needed when you only want to compute recall errors
 pair.read_antecedents(open('pair-dev.antecedents'))
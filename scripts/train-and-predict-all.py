@@ -1,7 +1,9 @@
 from __future__ import print_function
 
 
+import os
 import subprocess
+import sys
 
 
 __author__ = 'smartschat'
@@ -46,46 +48,69 @@ def get_clusterer(system):
         return "cort.coreference.clusterer.all_ante"
 
 
-systems = ["pair", "closest", "latent", "tree"]
-data_sets = ["dev", "test"]
+# starts training in the background and returns the training process, or
+# None if the model already exists from a previous run
+def train(system, data_set):
+    model = "model-" + system + "-" + data_set + ".obj"
 
-for system in systems:
-    print("Training", system, "on train.")
-    subprocess.call([
+    if os.path.exists(model):
+        print("Found", model + ", skipping training.")
+        return
+
+    print("Training", system, "on", data_set + ".")
+    return subprocess.Popen([
         "cort-train",
-        "-in", "/data/nlp/martscsn/thesis/data/input/train.auto",
-        "-out", "model-" + system + "-train.obj",
+        "-in", "/data/nlp/martscsn/thesis/data/input/" + data_set + ".auto",
+        "-out", model,
         "-extractor", get_extractor("train", system),
         "-perceptron", get_perceptron(system),
         "-cost_function", get_cost_function(system),
         "-cost_scaling", "100"])
 
-    print("Training", system, "on dev+train.")
-    subprocess.call([
-        "cort-train",
-        "-in", "/data/nlp/martscsn/thesis/data/input/train+dev.auto",
-        "-out", "model-" + system + "-train+dev.obj",
-        "-extractor", get_extractor("train", system),
+
+# waits for a training process started by train (if any), and stops if
+# training failed
+def wait_for_training(training, system, data_set):
+    if training and training.wait() != 0:
+        sys.exit("Training " + system + " on " + data_set + " failed.")
+
+
+def predict(system, data_set, model):
+    print("Predicting", system, "on", data_set)
+    return_code = subprocess.call([
+        "cort-predict-conll",
+        "-in", "/data/nlp/martscsn/thesis/data/input/" + data_set +
+        ".auto",
+        "-model", model,
+        "-out", system + "-" + data_set + ".out",
+        "-ante", system + "-" + data_set + ".antecedents",
+        "-gold", "/data/nlp/martscsn/thesis/data/input/" + data_set +
+        ".gold",
+        "-extractor", get_extractor(data_set, system),
         "-perceptron", get_perceptron(system),
-        "-cost_function", get_cost_function(system),
-        "-cost_scaling", "100"])
+        "-clusterer", get_clusterer(system)])
 
-    for data_set in data_sets:
-        print("Predicting", system, "on", data_set)
-        if data_set == "dev":
-            model = "model-" + system + "-train.obj"
-        else:
-            model = "model-" + system + "-train+dev.obj"
-
-        subprocess.call([
-            "cort-predict-conll",
-            "-in", "/data/nlp/martscsn/thesis/data/input/" + data_set +
-            ".auto",
-            "-model", model,
-            "-out", system + "-" + data_set + ".out",
-            "-ante", system + "-" + data_set + ".antecedents",
-            "-gold", "/data/nlp/martscsn/thesis/data/input/" + data_set +
-            ".gold",
-            "-extractor", get_extractor(data_set, system),
-            "-perceptron", get_perceptron(system),
-            "-clusterer", get_clusterer(system)])
+    if return_code != 0:
+        sys.exit("Predicting " + system + " on " + data_set + " failed.")
+
+
+systems = ["pair", "closest", "latent", "tree"]
+
+for system in systems:
+    # training on train+dev is independent of training on train and
+    # predicting on dev, so we run it in the background
+    train_dev_training = train(system, "train+dev")
+
+    try:
+        train_training = train(system, "train")
+        wait_for_training(train_training, system, "train")
+
+        predict(system, "dev", "model-" + system + "-train.obj")
+
+        wait_for_training(train_dev_training, system, "train+dev")
+    finally:
+        # do not leave training running in the background if we stop early
+        if train_dev_training and train_dev_training.poll() is None:
+            train_dev_training.terminate()
+
+    predict(system, "test", "model-" + system + "-train+dev.obj")
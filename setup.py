@@ -12,6 +12,8 @@ setup(
               'cort.test.multigraph',
               'cort.test.analysis',
               'cort.test.core',
+              'cort.test.approaches',
+              'cort.test.coreference',
               'cort.coreference.multigraph',
               'cort.coreference.approaches',
               'cort.util',